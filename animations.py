@@ -2,106 +2,172 @@ import pygame
 import math
 from settings import *
 
+EASING_STEPS = 256  # Samples per precomputed curve
+
+def build_easing_table(curve, steps=EASING_STEPS):
+    """Sample curve(progress) at evenly spaced progress values from 0 to 1"""
+    return [curve(i / (steps - 1)) for i in range(steps)]
+
+def ease(table, progress):
+    """Look up a precomputed curve at progress (0-1)"""
+    return table[int(progress * (len(table) - 1) + 0.5)]
+
+# Flip: squash to nothing at the midpoint, then grow back
+FLIP_CURVE = build_easing_table(lambda p: 1.0 - p * 2 if p < 0.5 else (p - 0.5) * 2)
+# Pop: grow 15% and settle back
+POP_CURVE = build_easing_table(lambda p: 1.0 + 0.15 * p * 2 if p < 0.5 else 1.15 - 0.15 * (p - 0.5) * 2)
+# Shake: damped sine, 4 swings
+SHAKE_CURVE = build_easing_table(lambda p: SHAKE_INTENSITY * math.sin(p * 4 * 2 * math.pi) * (1.0 - p))
+
+
+class ManualClock:
+    """Injectable clock for headless tests and benchmarks: time only moves when advanced"""
+    def __init__(self, start=0):
+        self.now = start
+    
+    def __call__(self):
+        return self.now
+    
+    def advance(self, ms):
+        self.now += ms
+
+
 class Animation:
-    def __init__(self, duration):
+    curve = None  # Easing table sampled by update()
+    
+    def __init__(self, duration, delay=0):
         self.duration = duration
-        self.start_time = pygame.time.get_ticks()
+        self.delay = delay
+        self.start_time = 0  # Set by AnimationManager.add()
         self.finished = False
+        self.value = self.curve[0]
+    
+    def start(self, now):
+        self.start_time = now + self.delay
     
-    def get_progress(self):
-        elapsed = pygame.time.get_ticks() - self.start_time
+    def get_progress(self, now):
+        elapsed = now - self.start_time
         progress = min(elapsed / self.duration, 1.0)
         if progress >= 1.0:
             self.finished = True
         return progress
     
-    def update(self):
-        pass
+    def update(self, now):
+        """Advance to the frame time now (ms), returns the current curve value"""
+        if now >= self.start_time:
+            self.value = ease(self.curve, self.get_progress(now))
+        return self.value
 
 class FlipAnimation(Animation):
+    kind = "flip"
+    blocks_input = True
+    curve = FLIP_CURVE
+    
     def __init__(self, row, col, delay=0):
-        super().__init__(FLIP_DURATION)
+        super().__init__(FLIP_DURATION, delay)
         self.row = row
         self.col = col
-        self.delay = delay
-        self.start_time += delay
-        self.scale_y = 1.0
-    
-    def update(self):
-        if pygame.time.get_ticks() < self.start_time:
-            return 1.0
-        
-        progress = self.get_progress()
-        if progress < 0.5:
-            self.scale_y = 1.0 - (progress * 2)
-        else:
-            self.scale_y = (progress - 0.5) * 2
-        return self.scale_y
 
 class PopAnimation(Animation):
+    kind = "pop"
+    blocks_input = False  # Typing continues while letters pop
+    curve = POP_CURVE
+    
     def __init__(self, row, col):
         super().__init__(POP_DURATION)
         self.row = row
         self.col = col
-        self.scale = 1.0
-    
-    def update(self):
-        progress = self.get_progress()
-        if progress < 0.5:
-            self.scale = 1.0 + (0.15 * (progress * 2))
-        else:
-            self.scale = 1.15 - (0.15 * ((progress - 0.5) * 2))
-        return self.scale
 
 class ShakeAnimation(Animation):
+    kind = "shake"
+    blocks_input = True
+    curve = SHAKE_CURVE
+    
     def __init__(self, row):
         super().__init__(SHAKE_DURATION)
         self.row = row
-        self.offset_x = 0
-    
-    def update(self):
-        progress = self.get_progress()
-        frequency = 4
-        damping = 1.0 - progress
-        self.offset_x = SHAKE_INTENSITY * math.sin(progress * frequency * 2 * math.pi) * damping
-        return self.offset_x
+        self.col = None  # Shakes the whole row
 
 class AnimationManager:
-    def __init__(self):
-        self.animations = []
+    """
+    Active animations indexed by (kind, row, col), so per-tile lookups and
+    removals are O(1). A newer animation replaces one with the same key.
+    The clock (ms, default pygame.time.get_ticks) is sampled once per
+    update() and the same frame time is passed to every animation.
+    """
+    def __init__(self, clock=None):
+        self.clock = clock or pygame.time.get_ticks
+        self.animations = {}  # (kind, row, col) -> Animation
+        self.blocking = 0  # Active animations that block input
     
     def add(self, animation):
-        self.animations.append(animation)
+        animation.start(self.clock())
+        key = (animation.kind, animation.row, animation.col)
+        self._remove(key)
+        self.animations[key] = animation
+        if animation.blocks_input:
+            self.blocking += 1
     
-    def update(self):
-        for anim in self.animations[:]:
-            anim.update()
+    def _remove(self, key):
+        animation = self.animations.pop(key, None)
+        if animation and animation.blocks_input:
+            self.blocking -= 1
+    
+    def update(self, now=None):
+        """Advance every animation to one frame time (sampled from the clock if not given)"""
+        if now is None:
+            now = self.clock()
+        finished = []
+        for key, anim in self.animations.items():
+            anim.update(now)
             if anim.finished:
-                self.animations.remove(anim)
+                finished.append(key)
+        for key in finished:
+            self._remove(key)
     
     def get_flip_scale(self, row, col):
-        for anim in self.animations:
-            if isinstance(anim, FlipAnimation) and anim.row == row and anim.col == col:
-                return anim.scale_y
-        return 1.0
+        anim = self.animations.get(("flip", row, col))
+        return anim.value if anim else 1.0
     
     def get_pop_scale(self, row, col):
-        for anim in self.animations:
-            if isinstance(anim, PopAnimation) and anim.row == row and anim.col == col:
-                return anim.scale
-        return 1.0
+        anim = self.animations.get(("pop", row, col))
+        return anim.value if anim else 1.0
     
     def get_shake_offset(self, row):
-        for anim in self.animations:
-            if isinstance(anim, ShakeAnimation) and anim.row == row:
-                return anim.offset_x
-        return 0
+        anim = self.animations.get(("shake", row, None))
+        return anim.value if anim else 0
+    
+    def has_animations(self):
+        """Any animation running, including input pops (the screen needs redrawing)"""
+        return bool(self.animations)
     
     def is_animating(self):
-        return any(
-            not isinstance(anim, PopAnimation)
-            for anim in self.animations
-        )
+        """Any animation running that should block input"""
+        return self.blocking > 0
     
     def clear(self):
-        self.animations.clear()
\ No newline at end of file
+        self.animations.clear()
+        self.blocking = 0
+
+
+# Benchmark: a 20-letter row flip driven by a manual clock (deterministic, no display needed)
+if __name__ == "__main__":
+    import time
+
+    clock = ManualClock()
+    manager = AnimationManager(clock)
+    for col in range(20):
+        manager.add(FlipAnimation(0, col, col * FLIP_DELAY))
+        manager.add(PopAnimation(1, col))
+
+    frames = 0
+    start = time.perf_counter()
+    while manager.has_animations():
+        clock.advance(1000 // 60)
+        manager.update()
+        for col in range(20):
+            manager.get_flip_scale(0, col)
+            manager.get_pop_scale(1, col)
+        frames += 1
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"{frames} frames, {elapsed / frames:.3f} ms per frame")
@@ -1,34 +1,83 @@
 import pygame
+import json
 import os
-from settings import IMAGE_PATHS
+from settings import IMAGE_PATHS, ATLAS_IMAGE_PATH, ATLAS_MANIFEST_PATH
 
 class AssetManager:
+    """Loads images on first use and caches scaled variants by (key, size)"""
     def __init__(self):
-        self.images = {}
-        self.load_all_assets()
+        self.images = {}  # key -> Surface, or None if missing
+        self.scaled = {}  # (key, (w, h)) -> Surface
+        self.atlas_keys = set()  # keys with pre-scaled sprites in the atlas
+        self.atlas_loaded = False
+    
+    def load_atlas(self):
+        """Register pre-scaled sprites from the atlas as subsurfaces (one image read)"""
+        self.atlas_loaded = True
+        if not (os.path.exists(ATLAS_MANIFEST_PATH) and os.path.exists(ATLAS_IMAGE_PATH)):
+            return
+        try:
+            with open(ATLAS_MANIFEST_PATH, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            atlas = pygame.image.load(ATLAS_IMAGE_PATH).convert_alpha()
+        except Exception as e:
+            print(f"Error loading atlas: {e}")
+            return
+        
+        sources = manifest.get("sources", {})
+        for sprite in manifest.get("sprites", {}).values():
+            key = sprite["key"]
+            if sources.get(key) != IMAGE_PATHS.get(key):
+                continue  # Image path changed since the atlas was built
+            x, y, w, h = sprite["rect"]
+            self.scaled[(key, (w, h))] = atlas.subsurface(pygame.Rect(x, y, w, h))
+            self.atlas_keys.add(key)
+        print(f"Loaded: {ATLAS_IMAGE_PATH} ({len(self.scaled)} sprites)")
     
     def load_all_assets(self):
-        for key, path in IMAGE_PATHS.items():
-            try:
-                if os.path.exists(path):
-                    image = pygame.image.load(path).convert_alpha()
-                    self.images[key] = image
-                    print(f"Loaded: {path}")
-                else:
-                    print(f"Missing: {path} (will use placeholder)")
-                    self.images[key] = None
-            except Exception as e:
-                print(f"Error loading {path}: {e}")
-                self.images[key] = None
+        """Load every image now instead of on first use"""
+        for key in IMAGE_PATHS:
+            self._load(key)
+    
+    def _load(self, key):
+        path = IMAGE_PATHS.get(key)
+        image = None
+        try:
+            if path and os.path.exists(path):
+                image = pygame.image.load(path).convert_alpha()
+                print(f"Loaded: {path}")
+            else:
+                print(f"Missing: {path} (will use placeholder)")
+        except Exception as e:
+            print(f"Error loading {path}: {e}")
+        self.images[key] = image
+        return image
     
     def get(self, key, size=None):
-        image = self.images.get(key)
+        if not self.atlas_loaded:
+            self.load_atlas()
+        
+        if size:
+            size = (int(size[0]), int(size[1]))
+            scaled = self.scaled.get((key, size))
+            if scaled is not None:
+                return scaled
+        
+        if key in self.images:
+            image = self.images[key]
+        else:
+            image = self._load(key)
+        
         if image and size:
-            return pygame.transform.smoothscale(image, size)
+            scaled = pygame.transform.smoothscale(image, size)
+            self.scaled[(key, size)] = scaled
+            return scaled
         return image
     
     def has(self, key):
-        return self.images.get(key) is not None
+        if not self.atlas_loaded:
+            self.load_atlas()
+        return key in self.atlas_keys or self.get(key) is not None
     
     def draw(self, screen, key, pos, size=None, center=False):
         image = self.get(key, size)
@@ -49,4 +98,13 @@ class AssetManager:
         
         for x in range(area_rect.left, area_rect.right, tile_size[0]):
             for y in range(area_rect.top, area_rect.bottom, tile_size[1]):
-                screen.blit(image, (x, y))
\ No newline at end of file
+                screen.blit(image, (x, y))
+
+_asset_manager = None
+
+def get_asset_manager():
+    """Process-wide AssetManager shared by all pages and game rounds"""
+    global _asset_manager
+    if _asset_manager is None:
+        _asset_manager = AssetManager()
+    return _asset_manager
@@ -0,0 +1,68 @@
+"""
+Offline asset build step: pre-scales every (image, size) pair the game draws
+into one atlas PNG plus a JSON manifest that AssetManager loads at startup.
+
+Run after changing images or sizes in settings.py:
+    python build_atlas.py
+"""
+import json
+import os
+import pygame
+from settings import IMAGE_PATHS, ATLAS_SIZES, ATLAS_IMAGE_PATH, ATLAS_MANIFEST_PATH
+
+ATLAS_WIDTH = 512
+SPRITE_PADDING = 2  # Keeps smoothscaled edges from bleeding into neighbours
+
+def sprite_name(key, size):
+    return f"{key}@{size[0]}x{size[1]}"
+
+def pack_shelves(sizes, width):
+    """
+    Simple shelf packer: tallest sprites first, left to right, new shelf when full
+    sizes: {name: (w, h)}
+    Returns: ({name: (x, y)}, atlas_height)
+    """
+    positions = {}
+    x = y = shelf_height = 0
+    for name, (w, h) in sorted(sizes.items(), key=lambda item: (-item[1][1], item[0])):
+        if x + w > width:
+            x = 0
+            y += shelf_height + SPRITE_PADDING
+            shelf_height = 0
+        positions[name] = (x, y)
+        x += w + SPRITE_PADDING
+        shelf_height = max(shelf_height, h)
+    return positions, y + shelf_height
+
+def build_atlas():
+    pygame.init()
+    sprites = {}
+    sources = {}
+    for key, sizes in ATLAS_SIZES.items():
+        path = IMAGE_PATHS.get(key)
+        if not path or not os.path.exists(path):
+            print(f"Missing: {path} (skipped)")
+            continue
+        image = pygame.image.load(path)
+        sources[key] = path
+        for size in sizes:
+            sprites[sprite_name(key, size)] = (key, pygame.transform.smoothscale(image, size))
+    
+    positions, height = pack_shelves({name: s.get_size() for name, (_, s) in sprites.items()}, ATLAS_WIDTH)
+    atlas = pygame.Surface((ATLAS_WIDTH, max(height, 1)), pygame.SRCALPHA)
+    atlas.fill((0, 0, 0, 0))
+    
+    manifest = {"image": os.path.basename(ATLAS_IMAGE_PATH), "sources": sources, "sprites": {}}
+    for name, (key, surface) in sprites.items():
+        x, y = positions[name]
+        atlas.blit(surface, (x, y))
+        w, h = surface.get_size()
+        manifest["sprites"][name] = {"key": key, "rect": [x, y, w, h]}
+    
+    pygame.image.save(atlas, ATLAS_IMAGE_PATH)
+    with open(ATLAS_MANIFEST_PATH, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    print(f"✓ Packed {len(sprites)} sprites into {ATLAS_IMAGE_PATH} ({ATLAS_WIDTH}x{height})")
+
+if __name__ == "__main__":
+    build_atlas()
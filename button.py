@@ -1,5 +1,6 @@
 import pygame
 from settings import BUTTON_BG, BUTTON_HOVER, BUTTON_TEXT, get_button_font
+from text_cache import render_text
 
 class Button:
     def __init__(self, x, y, width, height, text, callback, size = None):
@@ -7,11 +8,15 @@ class Button:
         self.text = text
         self.callback = callback
         self.hovered = False
+        self.needs_redraw = False  # Set when hover state changes, cleared by the page
         self.font = get_button_font(size) if size else get_button_font()
     
     def handle_event(self, event):
         if event.type == pygame.MOUSEMOTION:
-            self.hovered = self.rect.collidepoint(event.pos)
+            hovered = self.rect.collidepoint(event.pos)
+            if hovered != self.hovered:
+                self.hovered = hovered
+                self.needs_redraw = True
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if self.hovered and event.button == 1:
                 self.callback()
@@ -23,6 +28,6 @@ class Button:
         pygame.draw.rect(screen, color, self.rect, border_radius=10)
         pygame.draw.rect(screen, BUTTON_TEXT, self.rect, 3, border_radius=10)
         
-        text_surface = self.font.render(self.text, True, BUTTON_TEXT)
+        text_surface = render_text(self.font, self.text, True, BUTTON_TEXT)
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
\ No newline at end of file
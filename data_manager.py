@@ -3,6 +3,9 @@ import os
 import random
 from datetime import datetime
 
+# Definitions that mean "not filled in yet"
+PLACEHOLDER_DEFINITIONS = {"", "-", "?", "...", "tbd", "todo", "n/a", "none", "no definition"}
+
 class Word:
     """Represents a vocabulary word with learning status"""
     def __init__(self, word, definition, status="not_learned", attempts=0, correct=0, wrong=0):
@@ -58,6 +61,10 @@ class Word:
             self.wrong += 1
             self.status = "not_learned"
     
+    def needs_definition(self):
+        """Check if the definition is empty or a placeholder"""
+        return self.definition.strip().lower() in PLACEHOLDER_DEFINITIONS
+    
     def get_display_length(self):
         """Get word length including spaces and hyphens"""
         return len(self.word)
@@ -147,6 +154,30 @@ class DataManager:
         
         return True, f"Added '{word_text}' successfully!"
     
+    def add_words(self, pairs):
+        """
+        Add many (word, definition) pairs with one save
+        Skips invalid entries and words already in the deck or repeated in the batch
+        Returns: (added: int, skipped: int)
+        """
+        existing = {w.word for w in self.words}
+        added = 0
+        skipped = 0
+        
+        for word_text, definition in pairs:
+            word_text = word_text.strip().lower()
+            definition = definition.strip()
+            if not word_text or not definition or len(word_text) > 20 or word_text in existing:
+                skipped += 1
+                continue
+            self.words.append(Word(word_text, definition))
+            existing.add(word_text)
+            added += 1
+        
+        if added:
+            self.save_words()
+        return added, skipped
+    
     def word_exists(self, word_text):
         """Check if word already exists"""
         word_text = word_text.strip().lower()
@@ -167,6 +198,26 @@ class DataManager:
         self.save_words()
         return True
     
+    def get_words_missing_definitions(self):
+        """Get words whose definition is empty or a placeholder"""
+        return [w for w in self.words if w.needs_definition()]
+    
+    def apply_definitions(self, definitions):
+        """
+        Fill in missing definitions in one batch with a single save
+        definitions: {word_text: definition}
+        Returns: number of words updated
+        """
+        updated = 0
+        for word in self.words:
+            definition = definitions.get(word.word)
+            if definition and word.needs_definition():
+                word.definition = definition.strip()
+                updated += 1
+        if updated:
+            self.save_words()
+        return updated
+    
     def update_word_status(self, word_text, guessed_correctly, attempts_used):
         """Update word status after gameplay"""
         word = self.get_word(word_text)
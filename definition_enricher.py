@@ -0,0 +1,140 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dictionary_api import lookup_definition, ProviderError
+
+
+class TokenBucket:
+    """Rate limiter: allows `rate` calls per second with bursts up to `capacity`"""
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(1, int(rate))
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class DefinitionEnricher:
+    """
+    Fills in missing definitions for a whole deck.
+    Lookups run on a bounded thread pool behind a token-bucket rate limit;
+    progress is checkpointed next to the deck so an interrupted run resumes
+    where it stopped, and all results are committed with one save.
+    Words whose lookup failed are not recorded, so a later run retries them.
+    """
+    def __init__(self, data_manager, workers=4, rate=2.0,
+                 checkpoint_path=None, checkpoint_every=10):
+        self.data_manager = data_manager
+        self.workers = workers
+        self.limiter = TokenBucket(rate)
+        self.deck = os.path.abspath(data_manager.filepath)
+        self.checkpoint_path = checkpoint_path or os.path.splitext(data_manager.filepath)[0] + ".enrich_checkpoint.json"
+        self.checkpoint_every = checkpoint_every
+        self.results = {}  # word -> definition, or None if not found
+        self.failed = 0
+        self._lock = threading.Lock()
+
+    def load_checkpoint(self):
+        """Restore results from an interrupted run"""
+        if os.path.exists(self.checkpoint_path):
+            try:
+                with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get("deck") != self.deck:
+                    print(f"✗ Ignoring checkpoint for another deck: {data.get('deck')}")
+                    return
+                self.results = data.get("results", {})
+                print(f"✓ Resuming: {len(self.results)} words already looked up")
+            except Exception as e:
+                print(f"✗ Error loading checkpoint: {e}")
+                self.results = {}
+
+    def save_checkpoint(self):
+        with self._lock:
+            data = {"deck": self.deck, "results": dict(self.results)}
+        try:
+            with open(self.checkpoint_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+        except Exception as e:
+            print(f"✗ Error saving checkpoint: {e}")
+
+    def clear_checkpoint(self):
+        if os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+    def _lookup(self, word):
+        self.limiter.acquire()
+        return lookup_definition(word)
+
+    def run(self, progress_callback=None):
+        """
+        Look up every missing definition and save once.
+        progress_callback(done, total) is called after each lookup.
+        Returns: number of words updated
+        """
+        self.load_checkpoint()
+        missing = sorted({w.word for w in self.data_manager.get_words_missing_definitions()})
+        todo = [w for w in missing if w not in self.results]
+        total = len(missing)
+        done = total - len(todo)
+        self.failed = 0
+        print(f"Enriching {len(todo)} of {total} words missing definitions...")
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {executor.submit(self._lookup, word): word for word in todo}
+            for future in as_completed(futures):
+                word = futures[future]
+                try:
+                    definition = future.result()
+                except ProviderError as e:
+                    print(f"✗ Lookup failed for {word}: {e}")
+                    self.failed += 1
+                    continue  # Not recorded, so a later run retries it
+
+                with self._lock:
+                    self.results[word] = definition
+                done += 1
+                if done % self.checkpoint_every == 0:
+                    self.save_checkpoint()
+                if progress_callback:
+                    progress_callback(done, total)
+
+        found = {w: d for w, d in self.results.items() if d}
+        updated = self.data_manager.apply_definitions(found)
+        not_found = len(self.results) - len(found)
+        if self.failed:
+            self.save_checkpoint()  # Keep the misses so the retry only repeats failed words
+            print(f"✓ Filled {updated} definitions ({not_found} not found, {self.failed} failed: run again to retry)")
+        else:
+            self.clear_checkpoint()
+            print(f"✓ Filled {updated} definitions ({not_found} not found)")
+        return updated
+
+
+if __name__ == "__main__":
+    import argparse
+    from data_manager import DataManager
+
+    parser = argparse.ArgumentParser(description="Fill in missing definitions for the vocabulary deck")
+    parser.add_argument("--file", default="data/vocabulary.json", help="Vocabulary file")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent lookups")
+    parser.add_argument("--rate", type=float, default=2.0, help="Maximum lookups per second")
+    args = parser.parse_args()
+
+    enricher = DefinitionEnricher(DataManager(args.file), workers=args.workers, rate=args.rate)
+    enricher.run(lambda done, total: print(f"  {done}/{total}"))
@@ -1,54 +1,9 @@
-import requests
-import random
+from dictionary_providers import (
+    HttpProvider, OfflinePackProvider, CacheProvider, MockProvider, ProviderChain,
+    ProviderError, collect_stats, benchmark
+)
 
-def get_random_word():
-    """Get a random English word."""
-    try:
-        res = requests.get("https://random-word-api.herokuapp.com/word?lang=en")
-        if res.status_code == 200:
-            word = res.json()[0]
-            # Filter out very long words (max 20 chars)
-            if len(word) <= 20:
-                return word.lower()
-    except Exception as e:
-        print("Random word API error:", e)
-    return None
-
-def get_definition(word):
-    """Get definition from dictionaryapi.dev"""
-    try:
-        url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
-        res = requests.get(url, timeout=5)
-        if res.status_code == 200:
-            data = res.json()
-            meanings = data[0].get("meanings", [])
-            if meanings:
-                defs = meanings[0].get("definitions", [])
-                if defs:
-                    return defs[0].get("definition")
-    except Exception as e:
-        print("Definition API error:", e)
-    return None
-
-def get_random_word_with_definition(max_attempts=10):
-    """
-    Get a random word with its definition.
-    Tries multiple times if definition is not found.
-    Returns: (word, definition) tuple or (None, None)
-    """
-    for attempt in range(max_attempts):
-        word = get_random_word()
-        if word:
-            print(f"Trying word: {word}...")
-            definition = get_definition(word)
-            if definition:
-                print(f"✓ Found: {word} - {definition[:50]}...")
-                return word, definition
-            else:
-                print(f"✗ No definition for: {word}")
-    
-    print("Failed to get word after maximum attempts")
-    return None, None
+OFFLINE_PACK_PATH = "assets/dictionary.pack"
 
 # Fallback word list (in case API fails)
 FALLBACK_WORDS = [
@@ -64,12 +19,86 @@ FALLBACK_WORDS = [
     ("jungle", "An area of land overgrown with dense vegetation"),
 ]
 
+
+# Providers: offline pack first (local disk), then the online APIs.
+# Definitions are cached in memory in front of both.
+http_provider = HttpProvider()
+offline_provider = OfflinePackProvider(OFFLINE_PACK_PATH)
+fallback_provider = MockProvider(FALLBACK_WORDS, name="fallback")
+definition_provider = CacheProvider(ProviderChain([offline_provider, http_provider], name="definitions"))
+word_provider = ProviderChain([offline_provider, http_provider], name="words")
+
+def get_offline_word():
+    """Get a random (word, definition) from the offline pack or (None, None)"""
+    return offline_provider.random_entry()
+
+def get_random_word():
+    """Get a random English word from the batched candidate pool."""
+    return http_provider.candidate_pool.take()
+
+def get_definition(word):
+    """Get definition from the offline pack, then dictionaryapi.dev (cached)"""
+    return definition_provider.get_definition(word)
+
+def lookup_definition(word):
+    """
+    Like get_definition, but tells a failed lookup from a missing word.
+    Returns: the definition, or None if no source has the word
+    Raises: ProviderError if a source could not be reached
+    """
+    return definition_provider.lookup(word)
+
+def get_random_word_with_definition(max_attempts=10, concurrency=4):
+    """
+    Get a random word with its definition from the online APIs.
+    Tries up to max_attempts candidates, `concurrency` of them at a time.
+    Returns: (word, definition) tuple or (None, None)
+    """
+    word, definition = http_provider.random_entry(max_attempts, concurrency)
+    if word and definition:
+        print(f"✓ Found: {word} - {definition[:50]}...")
+        return word, definition
+    
+    print("Failed to get word after maximum attempts")
+    return None, None
+
+def get_word_with_definition():
+    """Get a random (word, definition) from the first provider that has one"""
+    return word_provider.random_entry()
+
 def get_fallback_word():
     """Get a random word from fallback list"""
-    return random.choice(FALLBACK_WORDS)
+    return fallback_provider.random_entry()
+
+def get_provider_stats():
+    """Latency histograms, error rates and hit ratios for every provider"""
+    return collect_stats(definition_provider, word_provider, fallback_provider)
+
+def dump_provider_stats():
+    """Print provider statistics"""
+    for name, stats in get_provider_stats().items():
+        print(f"[{name}] calls={stats['calls']} hit={stats['hit_ratio']:.0%} "
+              f"errors={stats['error_rate']:.0%} avg={stats['avg_ms']:.1f}ms max={stats['max_ms']:.1f}ms")
+        if "cache_hit_ratio" in stats:
+            print(f"    cache hit ratio: {stats['cache_hit_ratio']:.0%}")
+        if stats["histogram"]:
+            print("    " + "  ".join(f"{k}:{v}" for k, v in stats["histogram"].items()))
 
 # Test function
 if __name__ == "__main__":
+    import sys
+    
+    if "--bench" in sys.argv:
+        # Offline benchmark; add --online to include the HTTP provider
+        words = [w for w, _ in FALLBACK_WORDS] + ["purr", "whisker"]
+        candidates = [offline_provider, MockProvider(FALLBACK_WORDS, latency=0.002),
+                      CacheProvider(MockProvider(FALLBACK_WORDS, latency=0.002))]
+        if "--online" in sys.argv:
+            candidates.append(http_provider)
+        for name, stats in benchmark(candidates, words).items():
+            print(f"{name:>8}: avg={stats['avg_ms']:.2f}ms max={stats['max_ms']:.2f}ms hit={stats['hit_ratio']:.0%}")
+        sys.exit()
+    
     print("Testing Infinity Mode API...")
     word, definition = get_random_word_with_definition(max_attempts=5)
     if word and definition:
@@ -80,4 +109,5 @@ if __name__ == "__main__":
         print("\n✗ Failed, using fallback")
         word, definition = get_fallback_word()
         print(f"Word: {word}")
-        print(f"Definition: {definition}")
\ No newline at end of file
+        print(f"Definition: {definition}")
+    dump_provider_stats()
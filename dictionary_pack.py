@@ -0,0 +1,188 @@
+import json
+import mmap
+import os
+import random
+import struct
+
+# Pack layout (all integers little-endian):
+#   header   : magic (8 bytes), version (uint32), entry count (uint32)
+#   index    : count + 1 uint32 offsets into the data block
+#   data     : entries sorted by word, each "word\tdefinition" in UTF-8
+PACK_MAGIC = b"PURRDICT"
+PACK_VERSION = 1
+HEADER_FORMAT = "<8sII"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+OFFSET_FORMAT = "<I"
+OFFSET_SIZE = struct.calcsize(OFFSET_FORMAT)
+MAX_WORD_LENGTH = 20
+
+
+class DictionaryPack:
+    """Read-only, memory-mapped offline dictionary"""
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self._file = open(filepath, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            self._file.close()
+            raise ValueError(f"Invalid dictionary pack: {filepath}")
+
+        if not self._valid_layout():
+            self.close()
+            raise ValueError(f"Invalid dictionary pack: {filepath}")
+
+    def _valid_layout(self):
+        """Read the header and check that the index and data sizes match the entry count"""
+        size = len(self._mm)
+        if size < HEADER_SIZE:
+            return False
+        magic, version, count = struct.unpack_from(HEADER_FORMAT, self._mm, 0)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            return False
+
+        self.count = count
+        self._index_start = HEADER_SIZE
+        self._data_start = HEADER_SIZE + (count + 1) * OFFSET_SIZE
+        if self._data_start > size:
+            return False
+        # The last offset marks the end of the data block, which ends the file
+        return self._offset(0) == 0 and self._data_start + self._offset(count) == size
+
+    def __len__(self):
+        return self.count
+
+    def _offset(self, i):
+        return struct.unpack_from(OFFSET_FORMAT, self._mm, self._index_start + i * OFFSET_SIZE)[0]
+
+    def _entry_bytes(self, i):
+        start = self._data_start + self._offset(i)
+        end = self._data_start + self._offset(i + 1)
+        return self._mm[start:end]
+
+    def _word_bytes(self, i):
+        entry = self._entry_bytes(i)
+        return entry[:entry.index(b"\t")]
+
+    def entry(self, i):
+        """Get (word, definition) at position i in sorted order"""
+        word, definition = self._entry_bytes(i).split(b"\t", 1)
+        return word.decode("utf-8"), definition.decode("utf-8")
+
+    def lookup(self, word):
+        """Binary search for a word, returns its definition or None"""
+        target = word.strip().lower().encode("utf-8")
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._word_bytes(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.count:
+            found, definition = self.entry(lo)
+            if found.encode("utf-8") == target:
+                return definition
+        return None
+
+    def random_entry(self):
+        """Uniformly sample a (word, definition) pair"""
+        if not self.count:
+            return None, None
+        return self.entry(random.randrange(self.count))
+
+    def close(self):
+        self._mm.close()
+        self._file.close()
+
+
+def _clean(text):
+    """Collapse whitespace so entries never contain tabs or newlines"""
+    return " ".join(str(text).split())
+
+
+def load_definition_sources(paths):
+    """
+    Read definitions from JSON or TSV files.
+    JSON may be {"word": "definition"}, a list of {"word", "definition"}
+    objects, or a vocabulary file with a "words" list.
+    TSV/text files hold one "word<TAB>definition" pair per line.
+    """
+    definitions = {}
+    for path in paths:
+        if path.endswith(".json"):
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict) and "words" in data:
+                data = data["words"]
+            if isinstance(data, dict):
+                items = data.items()
+            else:
+                items = ((item.get("word", ""), item.get("definition", "")) for item in data)
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                items = [line.rstrip("\n").split("\t", 1) for line in f if "\t" in line]
+
+        for word, definition in items:
+            word = _clean(word).lower()
+            definition = _clean(definition)
+            if word and definition and word not in definitions:
+                definitions[word] = definition
+    return definitions
+
+
+def load_word_list(path):
+    """Read a plain text word list, one word per line"""
+    with open(path, "r", encoding="utf-8") as f:
+        return [_clean(line).lower() for line in f if line.strip()]
+
+
+def build_pack(definitions, output_path, words=None):
+    """
+    Write a dictionary pack.
+    definitions: {word: definition}
+    words: optional list restricting which words are packed
+    Returns: number of entries written
+    """
+    if words is not None:
+        wanted = set(words)
+        definitions = {w: d for w, d in definitions.items() if w in wanted}
+
+    entries = sorted(
+        (w.encode("utf-8"), d.encode("utf-8"))
+        for w, d in definitions.items()
+        if 0 < len(w) <= MAX_WORD_LENGTH and d
+    )
+
+    offsets = []
+    data = bytearray()
+    for word, definition in entries:
+        offsets.append(len(data))
+        data += word + b"\t" + definition
+    offsets.append(len(data))
+
+    directory = os.path.dirname(output_path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+
+    with open(output_path, "wb") as f:
+        f.write(struct.pack(HEADER_FORMAT, PACK_MAGIC, PACK_VERSION, len(entries)))
+        f.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        f.write(data)
+    return len(entries)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build an offline dictionary pack")
+    parser.add_argument("definitions", nargs="+", help="JSON or TSV definition sources")
+    parser.add_argument("--words", help="Optional word list (one word per line) to restrict the pack")
+    parser.add_argument("--output", "-o", default="assets/dictionary.pack", help="Output pack path")
+    args = parser.parse_args()
+
+    definitions = load_definition_sources(args.definitions)
+    words = load_word_list(args.words) if args.words else None
+    count = build_pack(definitions, args.output, words)
+    print(f"✓ Wrote {count} entries to {args.output}")
@@ -0,0 +1,416 @@
+import asyncio
+import os
+import random
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dictionary_pack import DictionaryPack
+from http_client import http_client
+
+RANDOM_WORD_URL = "https://random-word-api.herokuapp.com/word"
+DEFINITION_URL = "https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class ProviderStats:
+    """Per-provider call counts, latency histogram, error rate and hit ratio"""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.calls = 0
+        self.errors = 0
+        self.hits = 0  # Calls that returned a result
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def record(self, elapsed_ms, hit, error=False):
+        with self._lock:
+            self.calls += 1
+            self.hits += 1 if hit else 0
+            self.errors += 1 if error else 0
+            self.total_ms += elapsed_ms
+            self.max_ms = max(self.max_ms, elapsed_ms)
+            bucket = len(LATENCY_BUCKETS_MS)
+            for i, bound in enumerate(LATENCY_BUCKETS_MS):
+                if elapsed_ms <= bound:
+                    bucket = i
+                    break
+            self.histogram[bucket] += 1
+
+    def to_dict(self):
+        with self._lock:
+            labels = [f"<={b}ms" for b in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+            return {
+                "calls": self.calls,
+                "hit_ratio": self.hits / self.calls if self.calls else 0.0,
+                "error_rate": self.errors / self.calls if self.calls else 0.0,
+                "avg_ms": self.total_ms / self.calls if self.calls else 0.0,
+                "max_ms": self.max_ms,
+                "histogram": {label: n for label, n in zip(labels, self.histogram) if n},
+            }
+
+
+class ProviderError(Exception):
+    """A source failed to answer (network error, open circuit...), as opposed to a real miss"""
+
+
+class DictionaryProvider:
+    """
+    Base class for definition and random-word sources.
+    Subclasses implement _lookup and/or _random_entry; the public methods
+    time every call and record it in self.stats.
+    """
+    name = "provider"
+
+    def __init__(self):
+        self.stats = ProviderStats()
+
+    def _timed(self, fn, *args):
+        """Call fn, recording its latency; errors are re-raised as ProviderError"""
+        start = time.perf_counter()
+        try:
+            result = fn(*args)
+        except ProviderError:
+            self.stats.record((time.perf_counter() - start) * 1000, hit=False, error=True)
+            raise
+        except Exception as e:
+            print(f"{self.name} provider error: {e}")
+            self.stats.record((time.perf_counter() - start) * 1000, hit=False, error=True)
+            raise ProviderError(f"{self.name}: {e}") from e
+        self.stats.record((time.perf_counter() - start) * 1000, hit=bool(result))
+        return result
+
+    def lookup(self, word):
+        """
+        Get a definition for word.
+        Returns: the definition, or None if the source has no entry for it
+        Raises: ProviderError if the source could not answer
+        """
+        return self._timed(self._lookup, word.strip().lower())
+
+    def get_definition(self, word):
+        """Get a definition for word, or None (missing or failed)"""
+        try:
+            return self.lookup(word)
+        except ProviderError:
+            return None
+
+    def random_entry(self, *args):
+        """Get a random (word, definition), or (None, None)"""
+        try:
+            return self._timed(self._random_entry, *args) or (None, None)
+        except ProviderError:
+            return (None, None)
+
+    def _lookup(self, word):
+        return None
+
+    def _random_entry(self):
+        return None
+
+    def providers(self):
+        """This provider and any it wraps, for stats reporting"""
+        return [self]
+
+    def reset_stats(self):
+        self.stats.reset()
+
+
+class CandidatePool:
+    """
+    Local pool of random words fetched in batches.
+    Words are pre-filtered to what the game grid can show, so each
+    network call yields many playable candidates.
+    """
+    def __init__(self, batch_size=50, max_length=20):
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self.words = deque()
+        self._lock = threading.Lock()
+        self._refill_lock = threading.Lock()
+        self._valid = re.compile(r"[a-z][a-z \-]*")
+
+    def is_playable(self, word):
+        """Grid supports letters, spaces and hyphens, up to max_length"""
+        return len(word) <= self.max_length and self._valid.fullmatch(word) is not None
+
+    def refill(self):
+        """Fetch one batch of random words, returns number added"""
+        try:
+            data = http_client.get_json(RANDOM_WORD_URL, params={"number": self.batch_size, "lang": "en"})
+        except Exception as e:
+            print("Random word API error:", e)
+            return 0
+
+        words = [w.strip().lower() for w in data or [] if isinstance(w, str)]
+        words = [w for w in words if self.is_playable(w)]
+        with self._lock:
+            self.words.extend(words)
+        return len(words)
+
+    def _pop(self):
+        with self._lock:
+            return self.words.popleft() if self.words else None
+
+    def take(self):
+        """Get the next candidate word, refilling the pool when empty"""
+        word = self._pop()
+        if word:
+            return word
+        # One batch request at a time; concurrent callers share its result
+        with self._refill_lock:
+            word = self._pop()
+            if word is None and self.refill():
+                word = self._pop()
+        return word
+
+    def __len__(self):
+        return len(self.words)
+
+
+class HttpProvider(DictionaryProvider):
+    """Online APIs: random-word-api for words, dictionaryapi.dev for definitions"""
+    name = "http"
+
+    def __init__(self, candidates=5, concurrency=4):
+        super().__init__()
+        self.candidates = candidates
+        self.concurrency = concurrency
+        self.candidate_pool = CandidatePool()
+        # Threads used by the async fetcher; not shut down per call so that
+        # abandoned lookups never delay the winner
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="word-fetch")
+
+    def _lookup(self, word):
+        data = http_client.get_json(DEFINITION_URL.format(word=word))
+        if data:
+            meanings = data[0].get("meanings", [])
+            if meanings:
+                defs = meanings[0].get("definitions", [])
+                if defs:
+                    return defs[0].get("definition")
+        return None
+
+    def _random_entry(self, candidates=None, concurrency=None):
+        return asyncio.run(self.fetch_word_with_definition(
+            candidates or self.candidates, concurrency or self.concurrency
+        ))
+
+    async def _try_candidate(self, semaphore):
+        """Fetch one random word and its definition, returns (word, definition) or None"""
+        loop = asyncio.get_running_loop()
+        async with semaphore:
+            word = await loop.run_in_executor(self._executor, self.candidate_pool.take)
+            if not word:
+                return None
+            print(f"Trying word: {word}...")
+            definition = await loop.run_in_executor(self._executor, self.get_definition, word)
+            if not definition:
+                print(f"✗ No definition for: {word}")
+                return None
+            return word, definition
+
+    async def fetch_word_with_definition(self, candidates=10, concurrency=4):
+        """
+        Race several random candidates concurrently.
+        Returns the first (word, definition) found and cancels the rest, or None.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        pending = {asyncio.create_task(self._try_candidate(semaphore)) for _ in range(candidates)}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    if result:
+                        return result
+            return None
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+class OfflinePackProvider(DictionaryProvider):
+    """Memory-mapped offline dictionary pack, opened on first use"""
+    name = "offline"
+
+    def __init__(self, filepath):
+        super().__init__()
+        self.filepath = filepath
+        self._pack = None
+        self._checked = False
+        self._lock = threading.Lock()
+
+    def get_pack(self):
+        """Open the pack once, returns None if not installed"""
+        with self._lock:
+            if not self._checked:
+                self._checked = True
+                if os.path.exists(self.filepath):
+                    try:
+                        self._pack = DictionaryPack(self.filepath)
+                        print(f"✓ Loaded offline dictionary ({len(self._pack)} words)")
+                    except Exception as e:
+                        print("Offline dictionary error:", e)
+            return self._pack
+
+    def _lookup(self, word):
+        pack = self.get_pack()
+        return pack.lookup(word) if pack else None
+
+    def _random_entry(self):
+        pack = self.get_pack()
+        if pack and len(pack):
+            return pack.random_entry()
+        return None
+
+
+class CacheProvider(DictionaryProvider):
+    """
+    In-memory LRU cache of definitions in front of another provider.
+    Misses are kept for miss_ttl seconds so a word can be found later;
+    failed lookups (ProviderError) are never cached.
+    """
+    name = "cache"
+
+    def __init__(self, inner, max_size=2048, miss_ttl=600.0):
+        super().__init__()
+        self.inner = inner
+        self.max_size = max_size
+        self.miss_ttl = miss_ttl
+        self.cache_hits = 0
+        self._cache = OrderedDict()  # word -> (definition or None, expiry time or None)
+        self._lock = threading.Lock()
+
+    def reset_stats(self):
+        super().reset_stats()
+        self.cache_hits = 0
+
+    def _store(self, word, definition):
+        expires = None if definition else time.monotonic() + self.miss_ttl
+        with self._lock:
+            self._cache[word] = (definition, expires)
+            self._cache.move_to_end(word)
+            if len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+    def _lookup(self, word):
+        with self._lock:
+            entry = self._cache.get(word)
+            if entry is not None:
+                definition, expires = entry
+                if expires is None or time.monotonic() < expires:
+                    self._cache.move_to_end(word)
+                    self.cache_hits += 1
+                    return definition
+                del self._cache[word]  # Expired miss: ask again
+
+        definition = self.inner.lookup(word)  # ProviderError propagates uncached
+        self._store(word, definition)
+        return definition
+
+    def _random_entry(self):
+        entry = self.inner.random_entry()
+        if entry[0]:
+            self._store(entry[0], entry[1])
+            return entry
+        return None
+
+    def providers(self):
+        return [self] + self.inner.providers()
+
+
+class MockProvider(DictionaryProvider):
+    """Local in-memory provider with optional simulated latency, for offline benchmarks"""
+    name = "mock"
+
+    def __init__(self, entries, latency=0.0, name="mock"):
+        super().__init__()
+        self.name = name
+        self.entries = list(entries)
+        self.definitions = dict(self.entries)
+        self.latency = latency
+
+    def _lookup(self, word):
+        if self.latency:
+            time.sleep(self.latency)
+        return self.definitions.get(word)
+
+    def _random_entry(self):
+        if self.latency:
+            time.sleep(self.latency)
+        return random.choice(self.entries) if self.entries else None
+
+
+class ProviderChain(DictionaryProvider):
+    """Tries each provider in order until one returns a result"""
+    name = "chain"
+
+    def __init__(self, providers, name=None):
+        super().__init__()
+        self.chain = list(providers)
+        if name:
+            self.name = name
+
+    def _lookup(self, word):
+        error = None
+        for provider in self.chain:
+            try:
+                definition = provider.lookup(word)
+            except ProviderError as e:
+                error = e
+                continue
+            if definition:
+                return definition
+        if error:
+            raise error  # A source that failed might have had it: not a real miss
+        return None
+
+    def _random_entry(self):
+        for provider in self.chain:
+            word, definition = provider.random_entry()
+            if word and definition:
+                return word, definition
+        return None
+
+    def providers(self):
+        found = [self]
+        for provider in self.chain:
+            found.extend(p for p in provider.providers() if p not in found)
+        return found
+
+
+def collect_stats(*providers):
+    """Stats for every provider reachable from the given ones, keyed by name"""
+    seen = []
+    for provider in providers:
+        seen.extend(p for p in provider.providers() if p not in seen)
+    report = {}
+    for provider in seen:
+        stats = provider.stats.to_dict()
+        if isinstance(provider, CacheProvider):
+            stats["cache_hit_ratio"] = provider.cache_hits / stats["calls"] if stats["calls"] else 0.0
+        report[provider.name] = stats
+    return report
+
+
+def benchmark(providers, words, rounds=3):
+    """
+    Time definition lookups for each provider over the same word list.
+    Returns: {provider name: stats dict}
+    """
+    results = {}
+    for provider in providers:
+        provider.reset_stats()
+        for _ in range(rounds):
+            for word in words:
+                provider.get_definition(word)
+        results[provider.name] = provider.stats.to_dict()
+    return results
@@ -0,0 +1,47 @@
+import pygame
+
+class DirtyTracker:
+    """
+    Collects the screen regions a page changed since its last frame.
+    Pages draw with the screen clipped to those regions and return them
+    from render() so the main loop can update only what changed.
+    """
+    def __init__(self):
+        self.rects = []
+        self.full = True  # First frame draws everything
+
+    def mark(self, rect):
+        """Mark a region as needing a redraw"""
+        if not self.full:
+            self.rects.append(pygame.Rect(rect))
+
+    def mark_all(self):
+        """Mark the whole screen as needing a redraw"""
+        self.full = True
+        self.rects.clear()
+
+    def mark_changed(self, widgets):
+        """Mark widgets (buttons etc.) whose appearance changed since the last frame"""
+        for widget in widgets:
+            if widget.needs_redraw:
+                widget.needs_redraw = False
+                self.mark(widget.rect)
+
+    def __bool__(self):
+        return self.full or bool(self.rects)
+
+    def begin(self, screen):
+        """Clip drawing to the dirty regions; returns them"""
+        if self.full:
+            self.rects = [screen.get_rect()]
+        self.rects = [r.clip(screen.get_rect()) for r in self.rects]
+        screen.set_clip(self.rects[0].unionall(self.rects[1:]))
+        return self.rects
+
+    def end(self, screen):
+        """Reset the clip and hand back the regions drawn this frame"""
+        screen.set_clip(None)
+        rects = self.rects
+        self.rects = []
+        self.full = False
+        return rects
@@ -0,0 +1,181 @@
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Status codes worth retrying: rate limiting and upstream server errors
+RETRY_STATUS = {429, 500, 502, 503, 504}
+# Transport errors worth retrying; any other RequestException fails the call at once
+RETRY_EXCEPTIONS = (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError)
+
+
+class CircuitOpenError(Exception):
+    """Raised when a request is refused because the upstream is known to be down"""
+
+
+class CircuitBreaker:
+    """
+    Fails fast after repeated upstream failures.
+    closed    -> requests flow normally
+    open      -> requests are refused until reset_timeout has passed
+    half_open -> one trial request decides whether to close or re-open
+    """
+    def __init__(self, failure_threshold=3, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.state = "closed"
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """Check whether a request may be sent"""
+        with self._lock:
+            if self.state == "open":
+                if time.monotonic() - self.opened_at >= self.reset_timeout:
+                    self.state = "half_open"
+                    return True
+                return False
+            # Only the single trial request is allowed while half open
+            return self.state == "closed"
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.state = "closed"
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                self.state = "open"
+                self.opened_at = time.monotonic()
+
+
+class HttpClient:
+    """Shared HTTP client with keep-alive pooling, timeouts, retries and per-host circuit breakers"""
+    def __init__(self, timeout=(3.05, 5), retries=2, backoff=0.25, max_backoff=2.0,
+                 pool_size=8, failure_threshold=3, reset_timeout=30.0):
+        self.timeout = timeout  # (connect, read) seconds
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.breakers = {}
+        self._lock = threading.Lock()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get_breaker(self, url):
+        """Get the circuit breaker for a URL's host"""
+        host = urlsplit(url).netloc
+        with self._lock:
+            if host not in self.breakers:
+                self.breakers[host] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            return self.breakers[host]
+
+    def _sleep_backoff(self, attempt):
+        """Exponential backoff with full jitter"""
+        delay = min(self.max_backoff, self.backoff * (2 ** attempt))
+        time.sleep(random.uniform(0, delay))
+
+    def get_json(self, url, params=None, timeout=None):
+        """
+        GET a URL and decode its JSON body.
+        Returns: decoded JSON, or None for a non-retryable miss (e.g. 404)
+        Raises: CircuitOpenError when the host's breaker is open,
+                requests.RequestException when all retries fail
+        """
+        breaker = self.get_breaker(url)
+        if not breaker.allow():
+            raise CircuitOpenError(f"{urlsplit(url).netloc} is unavailable")
+
+        # Every call that got past allow() must settle the breaker, even when
+        # an unexpected exception escapes, or a half-open trial would leave
+        # the breaker refusing requests forever
+        settled = False
+        try:
+            error = None
+            for attempt in range(self.retries + 1):
+                if attempt:
+                    self._sleep_backoff(attempt - 1)
+                try:
+                    res = self.session.get(url, params=params, timeout=timeout or self.timeout)
+                except RETRY_EXCEPTIONS as e:
+                    error = e
+                    continue
+
+                if res.status_code in RETRY_STATUS:
+                    error = requests.HTTPError(f"{res.status_code} from {url}", response=res)
+                    continue
+
+                # The upstream answered: any other status is a real answer, not an outage
+                breaker.record_success()
+                settled = True
+                if res.status_code == 200:
+                    return res.json()
+                return None
+
+            raise error
+        finally:
+            if not settled:
+                breaker.record_failure()
+
+
+# Shared client used by dictionary_api
+http_client = HttpClient()
+
+
+# Test function: exercise retries and the circuit breaker against a local stand-in server
+if __name__ == "__main__":
+    import json
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    calls = {"count": 0}
+
+    class StandInHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            calls["count"] += 1
+            if self.path.startswith("/flaky") and calls["count"] % 2:
+                self.send_response(503)
+                self.end_headers()
+                return
+            if self.path.startswith("/down"):
+                self.send_response(500)
+                self.end_headers()
+                return
+            body = json.dumps(["purr"]).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    client = HttpClient(backoff=0.01, failure_threshold=2, reset_timeout=60)
+    print("OK:", client.get_json(f"{base}/ok"))
+    print("Flaky (retried):", client.get_json(f"{base}/flaky"))
+
+    for _ in range(2):
+        try:
+            client.get_json(f"{base}/down")
+        except requests.RequestException as e:
+            print("Down:", e)
+    try:
+        client.get_json(f"{base}/ok")
+    except CircuitOpenError as e:
+        print("✓ Circuit open, failing fast:", e)
+    server.shutdown()
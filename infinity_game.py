@@ -1,36 +1,68 @@
 import pygame
-import threading
+import time
 from settings import *
+from text_cache import render_text
 from vocab_game import VocabGame
+from button import Button
 from data_manager import Word
-from dictionary_api import get_random_word_with_definition, get_fallback_word
+from dictionary_api import get_word_with_definition, get_fallback_word
+from dirty import DirtyTracker
+from layers import layers
+from timers import scheduler
 
 class LoadingScreen:
     """Loading animation while fetching word from API"""
     def __init__(self):
         self.angle = 0
         self.font = get_title_font()
-        self.message_font = pygame.font.Font(None, 28)
+        self.message_font = get_font(None, 28)
         self.dots = 0
         self.dot_timer = 0
+        self.dirty = DirtyTracker()
+        self.spinner_rect = pygame.Rect(0, 0, 100, 100)
+        self.spinner_rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+        self.message_rect = pygame.Rect(0, 0, 400, 40)
+        self.message_rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 80)
+    
+    def invalidate(self):
+        """Redraw everything on the next frame"""
+        self.dirty.mark_all()
     
     def update(self):
         """Update loading animation"""
         self.angle += 5
+        self.dirty.mark(self.spinner_rect)
         self.dot_timer += 1
         if self.dot_timer >= 20:
             self.dots = (self.dots + 1) % 4
             self.dot_timer = 0
+            self.dirty.mark(self.message_rect)
     
-    def render(self, screen):
-        """Draw loading screen"""
-        screen.fill(BG_COLOR)
+    def _build_background(self, size):
+        """Compose the parts of the screen that never change"""
+        background = pygame.Surface(size)
+        background.fill(BG_COLOR)
         
         # Title
         title_text = "Infinity Mode"
-        title_surface = self.font.render(title_text, True, BLACK)
+        title_surface = render_text(self.font, title_text, True, BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 150))
-        screen.blit(title_surface, title_rect)
+        background.blit(title_surface, title_rect)
+        
+        # Hint
+        hint_text = "This may take a few seconds..."
+        hint_surface = render_text(get_font(None, 22), hint_text, True, (120, 120, 120))
+        hint_rect = hint_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100))
+        background.blit(hint_surface, hint_rect)
+        return background
+    
+    def render(self, screen):
+        """Draw loading screen, returns the dirty rects drawn"""
+        if not self.dirty:
+            return []
+        self.dirty.begin(screen)
+        
+        layers.blit(screen, "infinity_loading", self._build_background)
         
         # Loading spinner (simple circle animation)
         center_x = SCREEN_WIDTH // 2
@@ -50,74 +82,179 @@ class LoadingScreen:
         # Loading message
         dots_text = "." * self.dots
         message_text = f"Fetching random word{dots_text}"
-        message_surface = self.message_font.render(message_text, True, BLACK)
+        message_surface = render_text(self.message_font, message_text, True, BLACK)
         message_rect = message_surface.get_rect(center=(SCREEN_WIDTH // 2, center_y + 80))
         screen.blit(message_surface, message_rect)
         
-        # Hint
-        hint_text = "This may take a few seconds..."
-        hint_surface = pygame.font.Font(None, 22).render(hint_text, True, (120, 120, 120))
-        hint_rect = hint_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100))
-        screen.blit(hint_surface, hint_rect)
+        return self.dirty.end(screen)
+
+
+class SessionSummary:
+    """End-of-session screen offering to save played Infinity words to the deck"""
+    def __init__(self, words):
+        self.words = words  # [(word, definition)]
+        self.title_font = get_title_font()
+        self.message_font = get_message_font()
+        self.word_font = get_font(None, 28)
+        
+        self.save_button = Button(SCREEN_WIDTH // 2 - 170, SCREEN_HEIGHT - 140, 150, 50, "Save All", lambda: None)
+        self.skip_button = Button(SCREEN_WIDTH // 2 + 20, SCREEN_HEIGHT - 140, 150, 50, "Skip", lambda: None)
+        self.buttons = [self.save_button, self.skip_button]
+        self.dirty = DirtyTracker()
+    
+    def invalidate(self):
+        """Redraw everything on the next frame"""
+        self.dirty.mark_all()
+    
+    def handle_event(self, event):
+        """Returns "save" or "skip" when a button is clicked"""
+        if self.save_button.handle_event(event):
+            return "save"
+        if self.skip_button.handle_event(event):
+            return "skip"
+        self.dirty.mark_changed(self.buttons)
+        return None
+    
+    def render(self, screen):
+        """Draw the session summary, returns the dirty rects drawn"""
+        if not self.dirty:
+            return []
+        self.dirty.begin(screen)
+        screen.fill(BG_COLOR)
+        
+        title_surface = render_text(self.title_font, "Session Words", True, BLACK)
+        screen.blit(title_surface, title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80)))
+        
+        message = f"Save {len(self.words)} word(s) from this session to your deck?"
+        message_surface = render_text(self.message_font, message, True, BLACK)
+        screen.blit(message_surface, message_surface.get_rect(center=(SCREEN_WIDTH // 2, 150)))
+        
+        # Word list (as many as fit)
+        y_pos = 200
+        for word, definition in self.words[:12]:
+            if len(definition) > 70:
+                definition = definition[:70] + "..."
+            line_surface = render_text(self.word_font, f"{word} - {definition}", True, (80, 80, 80))
+            screen.blit(line_surface, line_surface.get_rect(center=(SCREEN_WIDTH // 2, y_pos)))
+            y_pos += 34
+        if len(self.words) > 12:
+            more_surface = render_text(self.word_font, f"... and {len(self.words) - 12} more", True, (120, 120, 120))
+            screen.blit(more_surface, more_surface.get_rect(center=(SCREEN_WIDTH // 2, y_pos)))
+        
+        for button in self.buttons:
+            button.render(screen)
+        
+        return self.dirty.end(screen)
+
+
+def fetch_word_pair():
+    """Fetch one (word, definition) pair: offline pack first, then the online APIs"""
+    return get_word_with_definition()
 
 
 class InfinityGameManager:
     """Manages Infinity Mode with API word fetching"""
-    def __init__(self, data_manager):
+    def __init__(self, data_manager, prefetcher):
         self.data_manager = data_manager
+        self.prefetcher = prefetcher  # Shared WordPrefetcher
         self.loading_screen = LoadingScreen()
         self.vocab_game = None
         
-        # Threading for API calls
+        # Words played this session, offered for saving to the deck at the end
+        self.session_words = {}  # word -> definition, in play order
+        self.summary = None
+        
+        # While loading, update() takes the word from the prefetch buffer once
+        # it is ready; a failed fetch (PREFETCH_EVENT) or INFINITY_TIMEOUT_EVENT
+        # switches to a fallback word instead
         self.is_loading = False
+        self.loading_since = 0.0
         self.word_data = None
         self.load_error = False
         
+        # Rendering: each view tracks its own dirty regions, this one is for the error screen
+        self.dirty = DirtyTracker()
+        self.current_view = None
+        
         # Start loading first word
         self.start_loading_word()
     
     def start_loading_word(self):
-        """Start fetching word in background thread"""
-        self.is_loading = True
+        """Take a prefetched word, or wait for one without blocking the main loop"""
         self.load_error = False
         self.word_data = None
         
-        # Start API call in separate thread
-        thread = threading.Thread(target=self._fetch_word_thread)
-        thread.daemon = True
-        thread.start()
+        pair = self.prefetcher.get_nowait()
+        if pair:
+            self._set_word(pair)
+            return
+        
+        self.is_loading = True
+        self.loading_since = time.perf_counter()
+        scheduler.schedule(self, INFINITY_FETCH_TIMEOUT * 1000, INFINITY_TIMEOUT_EVENT)
     
-    def _fetch_word_thread(self):
-        """Background thread to fetch word from API"""
-        try:
-            word, definition = get_random_word_with_definition(max_attempts=5)
-            
-            if word and definition:
-                # Create temporary Word object (not saved to data)
-                word_obj = Word(word, definition, status="infinity")
-                self.word_data = word_obj
-            else:
-                # Use fallback
-                print("API failed, using fallback word")
-                word, definition = get_fallback_word()
-                word_obj = Word(word, definition, status="infinity")
-                self.word_data = word_obj
-            
+    def _set_word(self, pair):
+        word, definition = pair
+        self.prefetcher.mark_played(word)
+        # Create temporary Word object (not saved to data)
+        self.word_data = Word(word, definition, status="infinity")
+        self.is_loading = False
+        scheduler.cancel_owner(self)  # Loading timeout
+    
+    def close(self):
+        """Stop prefetching and cancel timers when leaving Infinity mode"""
+        scheduler.cancel_owner(self)
+        self.prefetcher.stop()
+        if self.vocab_game:
+            self.vocab_game.close()
+    
+    def _poll_prefetcher(self):
+        """Take the awaited word once the prefetch buffer has one (main thread only)"""
+        pair = self.prefetcher.get_nowait(waiting_since=self.loading_since)
+        if pair:
+            self._set_word(pair)
+    
+    def handle_fetch_failed(self):
+        """A prefetch failed or the wait timed out: play a fallback word instead of waiting"""
+        if not self.is_loading:
+            return
+        self._poll_prefetcher()  # Another fetch may have filled the buffer meanwhile
+        if not self.is_loading:
+            return
+        
+        self.prefetcher.record_miss(self.loading_since)
+        print("API failed, using fallback word")
+        pair = get_fallback_word()
+        if pair[0]:
+            self._set_word(pair)
+        else:
             self.is_loading = False
-            
-        except Exception as e:
-            print(f"Error fetching word: {e}")
             self.load_error = True
-            self.is_loading = False
+            scheduler.cancel_owner(self)
     
     def handle_event(self, event):
         """Handle events"""
+        if self.summary:
+            result = self.summary.handle_event(event)
+            if result == "save":
+                added, skipped = self.data_manager.add_words(self.summary.words)
+                print(f"✓ Saved {added} infinity words to deck ({skipped} skipped)")
+            return "back" if result else None
+        
         if self.vocab_game:
-            return self.vocab_game.handle_event(event)
+            result = self.vocab_game.handle_event(event)
+            self._record_round()
+            if result == "back" and self.session_words:
+                # Offer to keep this session's words before leaving
+                self.summary = SessionSummary(list(self.session_words.items()))
+                return None
+            return result
         return None
     
     def update(self):
         """Update game state"""
+        if self.is_loading:
+            self._poll_prefetcher()
         if self.is_loading:
             self.loading_screen.update()
         elif self.word_data and not self.vocab_game:
@@ -125,35 +262,72 @@ class InfinityGameManager:
             self.vocab_game = VocabGame(self.data_manager, self.word_data)
         elif self.vocab_game:
             self.vocab_game.update()
+            self._record_round()
     
-    def handle_animation_complete(self):
-        """Handle animation completion in game"""
-        if self.vocab_game:
-            self.vocab_game.handle_animation_complete()
+    def _record_round(self):
+        """Add the current word to the session once its round has ended (won or revealed)"""
+        if self.vocab_game and self.vocab_game.game_over:
+            word = self.vocab_game.word_obj
+            self.session_words.setdefault(word.word, word.definition)
     
-    def render(self, screen):
-        """Render current state"""
-        if self.is_loading:
-            self.loading_screen.render(screen)
+    def next_update_in(self):
+        """Milliseconds until the current screen changes on its own, or None if idle"""
+        if self.is_loading or (self.word_data and not self.vocab_game):
+            return 0  # Spinner running, or a game is about to be created
+        if self.vocab_game and not self.summary:
+            return self.vocab_game.next_update_in()
+        return None
+    
+    def invalidate(self):
+        """Redraw everything on the next frame"""
+        self.dirty.mark_all()
+        for view in (self.summary, self.loading_screen, self.vocab_game):
+            if view:
+                view.invalidate()
+    
+    def _get_current_view(self):
+        """The screen currently shown (self for the error screen), or None"""
+        if self.summary:
+            return self.summary
+        elif self.is_loading:
+            return self.loading_screen
         elif self.load_error:
-            self._render_error_screen(screen)
-        elif self.vocab_game:
-            self.vocab_game.render(screen)
+            return self
+        return self.vocab_game
+    
+    def render(self, screen):
+        """Render current state, returns the dirty rects drawn"""
+        view = self._get_current_view()
+        if view is not self.current_view:
+            # Switched screens: the new one must repaint everything
+            self.current_view = view
+            self.invalidate()
+        
+        if view is self:
+            return self._render_error_screen(screen)
+        elif view:
+            return view.render(screen)
+        return []
     
     def _render_error_screen(self, screen):
         """Render error screen"""
+        if not self.dirty:
+            return []
+        self.dirty.begin(screen)
         screen.fill(BG_COLOR)
         
         error_font = get_message_font()
         error_text = "Failed to load word"
-        error_surface = error_font.render(error_text, True, (200, 50, 50))
+        error_surface = render_text(error_font, error_text, True, (200, 50, 50))
         error_rect = error_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 30))
         screen.blit(error_surface, error_rect)
         
         hint_text = "Check your internet connection"
-        hint_surface = pygame.font.Font(None, 24).render(hint_text, True, (120, 120, 120))
+        hint_surface = render_text(get_font(None, 24), hint_text, True, (120, 120, 120))
         hint_rect = hint_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 10))
         screen.blit(hint_surface, hint_rect)
+        
+        return self.dirty.end(screen)
     
     def should_load_new_word(self):
         """Check if game is over and we should load next word"""
@@ -163,5 +337,7 @@ class InfinityGameManager:
     
     def load_next_word(self):
         """Load next word after game over"""
+        if self.vocab_game:
+            self.vocab_game.close()
         self.vocab_game = None
         self.start_loading_word()
\ No newline at end of file
@@ -0,0 +1,38 @@
+class LayerCompositor:
+    """
+    Process-wide store of static background layers.
+    Each layer is built once per screen size by its builder and then shared,
+    so pages (and every VocabGame round) only blit it.
+    """
+    def __init__(self):
+        self.layers = {}  # (name, (width, height)) -> Surface
+        self.builds = 0
+
+    def get(self, name, size, builder):
+        """Get the layer for name at size, calling builder(size) to create it on first use"""
+        key = (name, tuple(size))
+        layer = self.layers.get(key)
+        if layer is None:
+            layer = builder(key[1])
+            self.layers[key] = layer
+            self.builds += 1
+        return layer
+
+    def blit(self, screen, name, builder):
+        """Draw a layer sized to fill screen"""
+        screen.blit(self.get(name, screen.get_size(), builder), (0, 0))
+
+    def invalidate(self, name=None):
+        """
+        Drop one layer (all sizes), or every layer, so it is rebuilt on next use
+        (e.g. after a theme change). Pages showing it should also be invalidated.
+        """
+        if name is None:
+            self.layers.clear()
+        else:
+            for key in [key for key in self.layers if key[0] == name]:
+                del self.layers[key]
+
+
+# Shared by every page
+layers = LayerCompositor()
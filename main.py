@@ -1,13 +1,32 @@
 import pygame
 import sys
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from settings import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, IDLE_WAIT_MS,
+    DEFINITION_LOOKUP_EVENT, ANIMATION_DONE_EVENT, PREFETCH_EVENT, INFINITY_TIMEOUT_EVENT,
+    INFINITY_PREFETCH_DEPTH, INFINITY_QUEUE_PATH, INFINITY_RECENT_LIMIT
+)
 from data_manager import DataManager
 from main_menu import MainMenu
 from word_input_page import WordInputPage
 from mode_select import ModeSelectPage
 from vocab_game import VocabGame
 from word_list_page import WordListPage
-from infinity_game import InfinityGameManager
+from infinity_game import InfinityGameManager, fetch_word_pair
+from word_prefetcher import WordPrefetcher
+from workers import get_executor
+from timers import scheduler
+
+def wait_for_events(timeout):
+    """
+    Get pending events. With a timeout (ms, None = idle) and nothing pending,
+    sleep until an event arrives instead of polling every frame.
+    """
+    if timeout == 0:
+        return pygame.event.get()
+    timeout = IDLE_WAIT_MS if timeout is None else min(timeout, IDLE_WAIT_MS)
+    event = pygame.event.wait(timeout)
+    events = [] if event.type == pygame.NOEVENT else [event]
+    return events + pygame.event.get()
 
 def main():
     pygame.init()
@@ -26,19 +45,44 @@ def main():
     word_list_page = WordListPage(data_manager)
     vocab_game = None  # Initialize when starting learning mode
     infinity_manager = None  # Initialize when starting infinity mode
+    word_prefetcher = None  # Started on first entry to infinity mode, then kept warm
+    rendered_page = None  # Page drawn last frame; a new page repaints in full
+    next_update = 0  # ms until the page changes on its own (0 = animating, None = idle)
     
     while True:
-        for event in pygame.event.get():
+        # Fire due timers, and wake for the next one even if the page is idle
+        scheduler.poll()
+        timer_due = scheduler.next_due_in()
+        if timer_due is not None:
+            next_update = timer_due if next_update is None else min(next_update, timer_due)
+        
+        for event in wait_for_events(next_update):
             if event.type == pygame.QUIT:
+                if word_prefetcher:
+                    word_prefetcher.save(INFINITY_QUEUE_PATH)
                 pygame.quit()
                 sys.exit()
             
-            # Animation complete event for games
-            if event.type == pygame.USEREVENT:
-                if vocab_game:
-                    vocab_game.handle_animation_complete()
-                elif infinity_manager:
-                    infinity_manager.handle_animation_complete()
+            # Window contents were lost (uncovered, restored): repaint everything
+            if event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                rendered_page = None
+            
+            # Background definition lookups finish even if the page was left
+            if event.type == DEFINITION_LOOKUP_EVENT:
+                word_input_page.handle_lookup_result(event)
+            
+            # Guess finished flipping (timers of games that were left are cancelled)
+            if event.type == ANIMATION_DONE_EVENT:
+                event.owner.handle_animation_complete()
+            
+            # Word prefetch failures and retries run on the main thread; a failure
+            # or a loading timeout makes Infinity mode fall back instead of waiting
+            if event.type == PREFETCH_EVENT:
+                event.owner.handle_event(event)
+                if infinity_manager and event.kind == "failed":
+                    infinity_manager.handle_fetch_failed()
+            if event.type == INFINITY_TIMEOUT_EVENT and event.owner is infinity_manager:
+                infinity_manager.handle_fetch_failed()
             
             # Handle events based on current page
             if current_page == "menu":
@@ -80,16 +124,26 @@ def main():
                         print("No words available! Add words first.")
                 elif result == "infinity":
                     # Start infinity mode
-                    infinity_manager = InfinityGameManager(data_manager)
+                    if word_prefetcher is None:
+                        word_prefetcher = WordPrefetcher(
+                            fetch_word_pair, get_executor(),
+                            depth=INFINITY_PREFETCH_DEPTH,
+                            recent_limit=INFINITY_RECENT_LIMIT
+                        )
+                        word_prefetcher.load(INFINITY_QUEUE_PATH)
+                    word_prefetcher.start()  # Stopped again when the manager closes
+                    infinity_manager = InfinityGameManager(data_manager, word_prefetcher)
                     current_page = "infinity_game"
             
             elif current_page == "vocab_game":
                 result = vocab_game.handle_event(event)
                 if result == "back":
                     current_page = "mode_select"
+                    vocab_game.close()
                     vocab_game = None
                 elif result == "continue":
                     # Get next word
+                    vocab_game.close()
                     word_obj = data_manager.get_random_word_weighted()
                     vocab_game = VocabGame(data_manager, word_obj)
             
@@ -97,6 +151,7 @@ def main():
                 result = infinity_manager.handle_event(event)
                 if result == "back":
                     current_page = "mode_select"
+                    infinity_manager.close()
                     infinity_manager = None
                 elif result == "continue":
                     # Load next random word from API
@@ -111,21 +166,33 @@ def main():
             infinity_manager.update()
         
         # Render
+        page = None
         if current_page == "menu":
-            menu.render(screen)
+            page = menu
         elif current_page == "add_words":
-            word_input_page.render(screen)
+            page = word_input_page
         elif current_page == "mode_select":
-            mode_select_page.render(screen)
+            page = mode_select_page
         elif current_page == "word_list":
-            word_list_page.render(screen)
+            page = word_list_page
         elif current_page == "vocab_game" and vocab_game:
-            vocab_game.render(screen)
+            page = vocab_game
         elif current_page == "infinity_game" and infinity_manager:
-            infinity_manager.render(screen)
+            page = infinity_manager
+        
+        if page is not rendered_page:
+            rendered_page = page
+            if page:
+                page.invalidate()
+        
+        # Pages redraw and return only the regions that changed
+        dirty_rects = page.render(screen) if page else []
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
         
-        pygame.display.update()
-        clock.tick(60)
+        # Full frame rate while something animates; otherwise wait for input or the next timer
+        next_update = page.next_update_in() if page else None
+        clock.tick(FPS)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,7 +1,10 @@
 import pygame
 from settings import *
+from text_cache import render_text
 from button import Button
-from assets import AssetManager
+from assets import get_asset_manager
+from dirty import DirtyTracker
+from layers import layers
 
 class MenuButton(Button):
     """Enhanced menu button with icons"""
@@ -17,12 +20,12 @@ class MenuButton(Button):
         pygame.draw.rect(screen, BUTTON_TEXT, self.rect, 3, border_radius=12)
         
         # Icon
-        icon_surface = self.icon_font.render(self.icon_text, True, BUTTON_TEXT)
+        icon_surface = render_text(self.icon_font, self.icon_text, True, BUTTON_TEXT)
         icon_rect = icon_surface.get_rect(center=(self.rect.centerx, self.rect.centery - 20))
         screen.blit(icon_surface, icon_rect)
         
         # Text
-        text_surface = self.font.render(self.text, True, BUTTON_TEXT)
+        text_surface = render_text(self.font, self.text, True, BUTTON_TEXT)
         text_rect = text_surface.get_rect(center=(self.rect.centerx, self.rect.centery + 25))
         screen.blit(text_surface, text_rect)
 
@@ -31,12 +34,12 @@ class MainMenu:
     """Main menu for navigation"""
     def __init__(self, data_manager):
         self.data_manager = data_manager
-        self.assets = AssetManager()
+        self.assets = get_asset_manager()
         
         # Fonts
         self.title_font = get_title_font()
         self.subtitle_font = get_subtitle_font()
-        self.stats_font = pygame.font.Font(None, 28)
+        self.stats_font = get_font(None, 28)
         
         # Buttons - centered layout
         button_width = 250
@@ -68,6 +71,9 @@ class MainMenu:
         
         self.buttons = [self.play_button, self.add_words_button, self.word_list_button]
         
+        # Rendering
+        self.dirty = DirtyTracker()
+        
         # Statistics cache
         self.stats = None
         self.update_stats()
@@ -75,6 +81,15 @@ class MainMenu:
     def update_stats(self):
         """Update statistics"""
         self.stats = self.data_manager.get_statistics()
+        self.dirty.mark_all()
+    
+    def invalidate(self):
+        """Redraw everything on the next frame"""
+        self.dirty.mark_all()
+    
+    def next_update_in(self):
+        """Nothing animates here: the menu only changes on input"""
+        return None
     
     def handle_event(self, event):
         """Handle button clicks"""
@@ -82,29 +97,40 @@ class MainMenu:
             result = button.handle_event(event)
             if result:
                 return button.callback()
+        self.dirty.mark_changed(self.buttons)
         return None
     
-    def render(self, screen):
-        """Draw the main menu"""
-        screen.fill(BG_COLOR)
+    def _build_background(self, size):
+        """Compose the parts of the menu that never change"""
+        background = pygame.Surface(size)
+        background.fill(BG_COLOR)
         
         # Title
         title_text = "PURRDLE"
         subtitle_text = " Vocabulary Learning "
         
-        title_surface = self.title_font.render(title_text, True, BLACK)
+        title_surface = render_text(self.title_font, title_text, True, BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 60))
-        screen.blit(title_surface, title_rect)
+        background.blit(title_surface, title_rect)
         
-        subtitle_surface = self.subtitle_font.render(subtitle_text, True, BLACK)
+        subtitle_surface = render_text(self.subtitle_font, subtitle_text, True, BLACK)
         subtitle_rect = subtitle_surface.get_rect(center=(SCREEN_WIDTH // 2, 110))
-        screen.blit(subtitle_surface, subtitle_rect)
+        background.blit(subtitle_surface, subtitle_rect)
         
         # Cat logos
         if self.assets.has("logo"):
             logo_y = title_rect.centery - 12
-            self.assets.draw(screen, "logo", (SCREEN_WIDTH // 2 - 170, logo_y), size=(100, 100), center=True)
-            self.assets.draw(screen, "logo", (SCREEN_WIDTH // 2 + 170, logo_y), size=(100, 100), center=True)
+            self.assets.draw(background, "logo", (SCREEN_WIDTH // 2 - 170, logo_y), size=(100, 100), center=True)
+            self.assets.draw(background, "logo", (SCREEN_WIDTH // 2 + 170, logo_y), size=(100, 100), center=True)
+        return background
+    
+    def render(self, screen):
+        """Draw the main menu, returns the dirty rects drawn"""
+        if not self.dirty:
+            return []
+        self.dirty.begin(screen)
+        
+        layers.blit(screen, "main_menu", self._build_background)
         
         # Buttons
         for button in self.buttons:
@@ -120,7 +146,7 @@ class MainMenu:
             pygame.draw.rect(screen, OUTLINE_COLOR, stats_rect, 2, border_radius=10)
             
             # Title
-            stats_title = self.subtitle_font.render("Your Progress", True, BLACK)
+            stats_title = render_text(self.subtitle_font, "Your Progress", True, BLACK)
             stats_title_rect = stats_title.get_rect(center=(SCREEN_WIDTH // 2, stats_y + 30))
             screen.blit(stats_title, stats_title_rect)
             
@@ -147,9 +173,11 @@ class MainMenu:
         # Instructions if no words
         if not self.stats or self.stats["total"] == 0:
             info_text = "Add words to start learning!"
-            info_surface = self.stats_font.render(info_text, True, (150, 150, 150))
+            info_surface = render_text(self.stats_font, info_text, True, (150, 150, 150))
             info_rect = info_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 80))
             screen.blit(info_surface, info_rect)
+        
+        return self.dirty.end(screen)
     
     def _draw_stat_bar(self, screen, x, y, width, count, color, label):
         """Draw a statistic bar"""
@@ -166,11 +194,11 @@ class MainMenu:
         pygame.draw.rect(screen, OUTLINE_COLOR, (x, y, width, bar_height), 2, border_radius=5)
         
         # Label
-        label_surface = pygame.font.Font(None, 20).render(label, True, BLACK)
+        label_surface = render_text(get_font(None, 20), label, True, BLACK)
         label_rect = label_surface.get_rect(center=(x + width // 2, y - 12))
         screen.blit(label_surface, label_rect)
         
         # Count
-        count_surface = pygame.font.Font(None, 24).render(str(count), True, BLACK)
+        count_surface = render_text(get_font(None, 24), str(count), True, BLACK)
         count_rect = count_surface.get_rect(center=(x + width // 2, y + bar_height // 2))
         screen.blit(count_surface, count_rect)
\ No newline at end of file
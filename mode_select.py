@@ -1,6 +1,10 @@
 import pygame
 from settings import *
+from text_cache import render_text
+from text_layout import wrap_text
 from button import Button
+from dirty import DirtyTracker
+from layers import layers
 
 class ModeButton(Button):
     """Game mode selection button"""
@@ -8,8 +12,8 @@ class ModeButton(Button):
         super().__init__(x, y, width, height, title, callback)
         self.description = description
         self.icon = icon
-        self.title_font = pygame.font.Font(None, 40)
-        self.desc_font = pygame.font.Font(None, 24)
+        self.title_font = get_font(None, 40)
+        self.desc_font = get_font(None, 24)
         self.icon_font = get_icon_font(65)
     
     def render(self, screen):
@@ -19,12 +23,12 @@ class ModeButton(Button):
         pygame.draw.rect(screen, BUTTON_TEXT, self.rect, 3, border_radius=15)
         
         # Icon at top
-        icon_surface = self.icon_font.render(self.icon, True, BUTTON_TEXT)
+        icon_surface = render_text(self.icon_font, self.icon, True, BUTTON_TEXT)
         icon_rect = icon_surface.get_rect(center=(self.rect.centerx, self.rect.y + 60))
         screen.blit(icon_surface, icon_rect)
         
         # Title
-        title_surface = self.title_font.render(self.text, True, BUTTON_TEXT)
+        title_surface = render_text(self.title_font, self.text, True, BUTTON_TEXT)
         title_rect = title_surface.get_rect(center=(self.rect.centerx, self.rect.centery + 10))
         screen.blit(title_surface, title_rect)
         
@@ -33,28 +37,12 @@ class ModeButton(Button):
     
     def _render_description(self, screen):
         """Render wrapped description text"""
-        words = self.description.split()
-        lines = []
-        current_line = ""
-        max_width = self.rect.width - 40
-        
-        for word in words:
-            test_line = current_line + word + " "
-            test_surface = self.desc_font.render(test_line, True, BUTTON_TEXT)
-            if test_surface.get_width() < max_width:
-                current_line = test_line
-            else:
-                if current_line:
-                    lines.append(current_line.strip())
-                current_line = word + " "
-        
-        if current_line:
-            lines.append(current_line.strip())
+        lines = wrap_text(self.desc_font, self.description, self.rect.width - 40)
         
         # Render lines
         y_offset = self.rect.centery + 45
         for line in lines[:3]:
-            line_surface = self.desc_font.render(line, True, BUTTON_TEXT)
+            line_surface = render_text(self.desc_font, line, True, BUTTON_TEXT)
             line_rect = line_surface.get_rect(center=(self.rect.centerx, y_offset))
             screen.blit(line_surface, line_rect)
             y_offset += 28
@@ -68,7 +56,7 @@ class ModeSelectPage:
         # Fonts
         self.title_font = get_title_font()
         self.subtitle_font = get_subtitle_font()
-        self.info_font = pygame.font.Font(None, 26)
+        self.info_font = get_font(None, 26)
         
         # Mode buttons
         button_width = 250
@@ -99,6 +87,17 @@ class ModeSelectPage:
         self.back_button = Button(20, 20, 100, 40, "← Back", lambda: "back", 18)
         
         self.buttons = [self.learning_button, self.infinity_button, self.back_button]
+        
+        # Rendering
+        self.dirty = DirtyTracker()
+    
+    def invalidate(self):
+        """Redraw everything on the next frame"""
+        self.dirty.mark_all()
+    
+    def next_update_in(self):
+        """Nothing animates here: the page only changes on input"""
+        return None
     
     def handle_event(self, event):
         """Handle button clicks"""
@@ -106,23 +105,34 @@ class ModeSelectPage:
             result = button.handle_event(event)
             if result:
                 return button.callback()
+        self.dirty.mark_changed(self.buttons)
         return None
     
-    def render(self, screen):
-        """Draw the mode selection page"""
-        screen.fill(BG_COLOR)
+    def _build_background(self, size):
+        """Compose the parts of the page that never change"""
+        background = pygame.Surface(size)
+        background.fill(BG_COLOR)
         
         # Title
         title_text = "Choose Game Mode"
-        title_surface = self.title_font.render(title_text, True, BLACK)
+        title_surface = render_text(self.title_font, title_text, True, BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 60))
-        screen.blit(title_surface, title_rect)
+        background.blit(title_surface, title_rect)
         
         # Subtitle
         subtitle_text = "How do you want to play?"
-        subtitle_surface = self.subtitle_font.render(subtitle_text, True, BLACK)
+        subtitle_surface = render_text(self.subtitle_font, subtitle_text, True, BLACK)
         subtitle_rect = subtitle_surface.get_rect(center=(SCREEN_WIDTH // 2, 110))
-        screen.blit(subtitle_surface, subtitle_rect)
+        background.blit(subtitle_surface, subtitle_rect)
+        return background
+    
+    def render(self, screen):
+        """Draw the mode selection page, returns the dirty rects drawn"""
+        if not self.dirty:
+            return []
+        self.dirty.begin(screen)
+        
+        layers.blit(screen, "mode_select", self._build_background)
         
         # Buttons
         for button in self.buttons:
@@ -133,14 +143,14 @@ class ModeSelectPage:
         if stats["total"] > 0:
             info_y = 520
             info_text = f"You have {stats['total']} word(s) in your learning list"
-            info_surface = self.info_font.render(info_text, True, (100, 100, 100))
+            info_surface = render_text(self.info_font, info_text, True, (100, 100, 100))
             info_rect = info_surface.get_rect(center=(SCREEN_WIDTH // 2, info_y))
             screen.blit(info_surface, info_rect)
         else:
             # No words warning
             warning_y = 520
             warning_text = "⚠ Add words first to use Learning Mode!"
-            warning_surface = self.info_font.render(warning_text, True, (200, 50, 50))
+            warning_surface = render_text(self.info_font, warning_text, True, (200, 50, 50))
             warning_rect = warning_surface.get_rect(center=(SCREEN_WIDTH // 2, warning_y))
             screen.blit(warning_surface, warning_rect)
             
@@ -148,4 +158,6 @@ class ModeSelectPage:
             overlay = pygame.Surface((self.learning_button.rect.width, self.learning_button.rect.height))
             overlay.set_alpha(128)
             overlay.fill((150, 150, 150))
-            screen.blit(overlay, self.learning_button.rect.topleft)
\ No newline at end of file
+            screen.blit(overlay, self.learning_button.rect.topleft)
+        
+        return self.dirty.end(screen)
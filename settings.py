@@ -65,6 +65,33 @@ KEY_HOVER = (215, 210, 215)
 KEY_BORDER = (200, 195, 200)
 KEYBOARD_BG = WHITE
 
+# Frame pacing
+FPS = 60
+IDLE_WAIT_MS = 1000  # longest sleep while idle, so background results are still picked up
+CURSOR_BLINK_MS = 500
+MESSAGE_DURATION_MS = 3000  # how long feedback messages stay on screen
+
+# Rendering caches
+TEXT_CACHE_BUDGET = 8 * 1024 * 1024  # bytes of rendered text surfaces kept
+CARD_CACHE_BUDGET = 16 * 1024 * 1024  # bytes of pre-rendered word list cards kept
+TILE_CACHE_BUDGET = 4 * 1024 * 1024  # bytes of pre-rendered grid tiles kept
+TEXT_LAYOUT_CACHE_SIZE = 256  # wrapped text layouts kept
+
+# Background work
+WORKER_THREADS = 4
+
+# Custom events
+DEFINITION_LOOKUP_EVENT = pygame.USEREVENT + 1
+ANIMATION_DONE_EVENT = pygame.USEREVENT + 2  # Posted by the timer scheduler when a guess finishes flipping
+PREFETCH_EVENT = pygame.USEREVENT + 3  # Infinity word fetch failed (from a worker) or its retry is due (timer)
+INFINITY_TIMEOUT_EVENT = pygame.USEREVENT + 4  # Waited INFINITY_FETCH_TIMEOUT for an Infinity word
+
+# Infinity mode settings
+INFINITY_PREFETCH_DEPTH = 3   # words kept ready in the background
+INFINITY_FETCH_TIMEOUT = 15   # seconds to wait before using a fallback word
+INFINITY_QUEUE_PATH = "data/infinity_queue.json"  # ready words kept between launches
+INFINITY_RECENT_LIMIT = 100   # recently played words that are not queued again
+
 IMAGE_PATHS = {
     "logo": "assets/cat_logo.png",
     
@@ -76,6 +103,18 @@ IMAGE_PATHS = {
     "cat2": "assets/cat2.png",
 }
 
+# Pre-scaled sprite atlas (rebuild with: python build_atlas.py)
+ATLAS_IMAGE_PATH = "assets/atlas.png"
+ATLAS_MANIFEST_PATH = "assets/atlas.json"
+ATLAS_SIZES = {
+    "logo": [(100, 100)],
+    "cat_win": [(100, 100)],
+    "cat_lose": [(100, 100)],
+    "paw_print": [(50, 50)],
+    "cat1": [(80, 80)],
+    "cat2": [(80, 80)],
+}
+
 # Cat theme settings
 CAT_THEME = {
     "title": "PURRDLE",
@@ -94,23 +133,40 @@ CAT_THEME = {
     ]
 }
 
+# Font registry: every (path, size) is loaded from disk once and shared
+_font_cache = {}
+
+def get_font(path, size):
+    """Get a shared pygame Font, loading it on first use"""
+    key = (path, size)
+    font = _font_cache.get(key)
+    if font is None:
+        font = pygame.font.Font(path, size)
+        _font_cache[key] = font
+    return font
+
+def font_report():
+    """Number of distinct fonts loaded and their (path, size) keys"""
+    keys = sorted(_font_cache, key=lambda k: (k[0] or "", k[1]))
+    return {"distinct_fonts": len(keys), "fonts": keys}
+
 def get_letter_font():
-    return pygame.font.Font(None, 52)  
+    return get_font(None, 52)  
 
 def get_message_font(): 
-    return pygame.font.Font("assets/fonts/Comfortaa-Regular.ttf", 24)
+    return get_font("assets/fonts/Comfortaa-Regular.ttf", 24)
 
 def get_title_font():
-    return pygame.font.Font("assets/fonts/LuckiestGuy-Regular.ttf", 64)  
+    return get_font("assets/fonts/LuckiestGuy-Regular.ttf", 64)  
 
 def get_subtitle_font():
-    return pygame.font.Font("assets/fonts/Comfortaa-Regular.ttf", 28)
+    return get_font("assets/fonts/Comfortaa-Regular.ttf", 28)
 
 def get_button_font(size=25):
-    return pygame.font.Font("assets/fonts/Comfortaa-Regular.ttf", size)
+    return get_font("assets/fonts/Comfortaa-Regular.ttf", size)
 
 def get_key_font():
-    return pygame.font.Font(None, 32)
+    return get_font(None, 32)
 
 def get_icon_font(size=48):
-    return pygame.font.Font("assets/fonts/segoe-ui-emoji.ttf", size)
\ No newline at end of file
+    return get_font("assets/fonts/segoe-ui-emoji.ttf", size)
\ No newline at end of file
@@ -0,0 +1,66 @@
+from collections import OrderedDict
+from settings import TEXT_CACHE_BUDGET
+
+class SurfaceCache:
+    """
+    LRU cache of pre-rendered surfaces.
+    Evicts least recently used surfaces once their pixel memory exceeds the budget.
+    Cached surfaces are shared: blit them, never draw on them.
+    """
+    def __init__(self, budget_bytes):
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key, build, *args):
+        """Get the surface for key, calling build(*args) to render it on a miss"""
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        
+        self.misses += 1
+        surface = build(*args)
+        size = surface.get_width() * surface.get_height() * surface.get_bytesize()
+        self.surfaces[key] = surface
+        self.used_bytes += size
+        
+        while self.used_bytes > self.budget_bytes and len(self.surfaces) > 1:
+            _, old = self.surfaces.popitem(last=False)
+            self.used_bytes -= old.get_width() * old.get_height() * old.get_bytesize()
+            self.evictions += 1
+        return surface
+    
+    def clear(self):
+        self.surfaces.clear()
+        self.used_bytes = 0
+    
+    def stats(self):
+        """Hit/miss counters and memory use"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.surfaces),
+            "used_bytes": self.used_bytes,
+            "budget_bytes": self.budget_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class TextCache(SurfaceCache):
+    """Rendered text surfaces keyed by (font, text, antialias, color)"""
+    def render(self, font, text, antialias, color):
+        return self.get((font, text, antialias, tuple(color)), font.render, text, antialias, color)
+
+
+text_cache = TextCache(TEXT_CACHE_BUDGET)
+
+def render_text(font, text, antialias, color):
+    """Cached replacement for font.render(text, antialias, color)"""
+    return text_cache.render(font, text, antialias, color)
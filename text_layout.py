@@ -0,0 +1,91 @@
+import re
+from collections import OrderedDict
+from settings import TEXT_LAYOUT_CACHE_SIZE
+
+WHITESPACE = re.compile(r'\s+')
+
+class TextLayout:
+    """
+    Greedy word wrapping measured with font.size (no test renders).
+    Layouts are memoized by (font, text, max_width). When text only grows
+    (typing), wrapping resumes from the last complete word of the previous
+    layout instead of starting over.
+    """
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.layouts = OrderedDict()  # (font, text, max_width) -> tuple of lines
+        self.resume = {}  # (font, max_width) -> (prefix, lines, current line) before the prefix's last word
+        self.hits = 0
+        self.misses = 0
+        self.resumed = 0
+
+    def wrap(self, font, text, max_width):
+        """Split text into lines narrower than max_width, returns a tuple of lines"""
+        key = (font, text, max_width)
+        lines = self.layouts.get(key)
+        if lines is not None:
+            self.layouts.move_to_end(key)
+            self.hits += 1
+            return lines
+
+        self.misses += 1
+        lines = self._layout(font, text, max_width)
+        self.layouts[key] = lines
+        if len(self.layouts) > self.max_entries:
+            self.layouts.popitem(last=False)
+        return lines
+
+    def _layout(self, font, text, max_width):
+        # Any whitespace run separates words, like str.split(); a trailing
+        # space is kept so the last word still counts as complete
+        text = WHITESPACE.sub(' ', text).lstrip(' ')
+
+        # Everything up to the last space is made of complete words, so the
+        # wrap state after them is reusable by any text that extends them
+        lines, current, start = [], "", 0
+        saved = self.resume.get((font, max_width))
+        if saved and text.startswith(saved[0]):
+            prefix, saved_lines, current = saved
+            lines = list(saved_lines)
+            start = len(prefix)
+            self.resumed += 1
+
+        words = text[start:].split(' ')
+        for word in words[:-1]:
+            current = self._add_word(font, lines, current, word, max_width)
+        self.resume[(font, max_width)] = (text[:text.rfind(' ') + 1], tuple(lines), current)
+        current = self._add_word(font, lines, current, words[-1], max_width)
+
+        if current:
+            lines.append(current)
+        return tuple(line for line in (line.rstrip(' ') for line in lines) if line)
+
+    def _add_word(self, font, lines, current, word, max_width):
+        """Append word to the current line, or start a new line; returns the current line"""
+        test_line = current + word + " "
+        if font.size(test_line)[0] < max_width:
+            return test_line
+        if current:
+            lines.append(current)
+        return word + " "
+
+    def clear(self):
+        self.layouts.clear()
+        self.resume.clear()
+
+    def stats(self):
+        """Hit/miss counters"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.layouts),
+            "hits": self.hits,
+            "misses": self.misses,
+            "resumed": self.resumed,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+text_layout = TextLayout(TEXT_LAYOUT_CACHE_SIZE)
+
+def wrap_text(font, text, max_width):
+    """Cached word wrap: the lines of text that fit within max_width pixels"""
+    return text_layout.wrap(font, text, max_width)
@@ -0,0 +1,80 @@
+import heapq
+import itertools
+import pygame
+from workers import post_event
+
+
+class TimerHandle:
+    """A scheduled event; pass to TimerScheduler.cancel() to stop it firing"""
+    def __init__(self, due, owner, event_type, attrs):
+        self.due = due
+        self.owner = owner
+        self.event_type = event_type
+        self.attrs = attrs
+        self.cancelled = False
+
+
+class TimerScheduler:
+    """
+    One-shot timers kept in a min-heap by due time (O(log n) to schedule).
+    Each timer belongs to an owner (usually a page) so everything an owner
+    scheduled can be cancelled when it goes away. Due timers are posted as
+    pygame events of their own type, with the owner attached.
+    """
+    def __init__(self, clock=None):
+        self.clock = clock or pygame.time.get_ticks  # ms, injectable for tests
+        self.heap = []  # (due, sequence, handle)
+        self.owners = {}  # owner -> set of pending handles
+        self._sequence = itertools.count()  # Keeps equal due times in scheduling order
+
+    def schedule(self, owner, delay_ms, event_type, **attrs):
+        """Post event_type (with owner= and attrs) after delay_ms, returns a TimerHandle"""
+        handle = TimerHandle(self.clock() + delay_ms, owner, event_type, attrs)
+        heapq.heappush(self.heap, (handle.due, next(self._sequence), handle))
+        self.owners.setdefault(owner, set()).add(handle)
+        return handle
+
+    def cancel(self, handle):
+        """Stop a timer from firing (it is dropped from the heap lazily)"""
+        handle.cancelled = True
+        pending = self.owners.get(handle.owner)
+        if pending is not None:
+            pending.discard(handle)
+            if not pending:
+                del self.owners[handle.owner]
+
+    def cancel_owner(self, owner):
+        """Cancel every pending timer scheduled by owner"""
+        for handle in self.owners.pop(owner, ()):
+            handle.cancelled = True
+
+    def poll(self, now=None):
+        """Post the events of all due timers, returns how many fired"""
+        if now is None:
+            now = self.clock()
+        fired = 0
+        while self.heap and self.heap[0][0] <= now:
+            _, _, handle = heapq.heappop(self.heap)
+            if handle.cancelled:
+                continue
+            self.cancel(handle)  # No longer pending
+            post_event(handle.event_type, owner=handle.owner, **handle.attrs)
+            fired += 1
+        return fired
+
+    def next_due_in(self, now=None):
+        """Milliseconds until the next live timer fires, or None if none are pending"""
+        while self.heap and self.heap[0][2].cancelled:
+            heapq.heappop(self.heap)
+        if not self.heap:
+            return None
+        if now is None:
+            now = self.clock()
+        return max(0, self.heap[0][0] - now)
+
+    def __len__(self):
+        return sum(len(pending) for pending in self.owners.values())
+
+
+# Shared scheduler polled by the main loop
+scheduler = TimerScheduler()
@@ -1,14 +1,22 @@
 import pygame
 import sys
 from settings import * 
+from text_cache import render_text, SurfaceCache
+from text_layout import wrap_text
 from animations import AnimationManager, FlipAnimation, PopAnimation, ShakeAnimation
 from button import Button
-from assets import AssetManager
+from assets import get_asset_manager
 from data_manager import DataManager
+from dirty import DirtyTracker
+from timers import scheduler
+from layers import layers
+
+# Tile sprites shared by every game, keyed by (letter, color state, tile size)
+tile_cache = SurfaceCache(TILE_CACHE_BUDGET)
 
 class VocabGame:
     """Vocabulary learning game with dynamic grid"""
-    def __init__(self, data_manager, word_obj):
+    def __init__(self, data_manager, word_obj, clock=None):
         self.data_manager = data_manager
         self.word_obj = word_obj  # Word object from data_manager
         
@@ -38,11 +46,11 @@ class VocabGame:
             "letter": self.get_dynamic_letter_font(),
             "message": get_message_font(),
             "title": get_title_font(),
-            "definition": pygame.font.Font(None, 28)
+            "definition": get_font(None, 28)
         }
         
-        self.animation_manager = AnimationManager()
-        self.assets = AssetManager()
+        self.animation_manager = AnimationManager(clock)  # clock: injectable ms source for tests
+        self.assets = get_asset_manager()
         
         # Back button (top left)
         self.back_button = Button(20, 20, 100, 40, "← Back", lambda: None, 18)
@@ -59,10 +67,21 @@ class VocabGame:
         
         self.can_input = True
         
-        # Cache surfaces
+        # Cache surfaces (the decorated background is a shared layer, see _build_background)
         self.def_surfaces = self.render_definition_wrapped()
-        self.decor_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        self.render_decorations(self.decor_surface)
+        
+        # Rendering
+        self.dirty = DirtyTracker()
+        grid_height = self.grid_rows * (self.tile_size + self.tile_padding)
+        self.grid_area = pygame.Rect(0, self.grid_start_y - 10, SCREEN_WIDTH, grid_height + 45)  # Tiles + attempt counter
+    
+    def invalidate(self):
+        """Redraw everything on the next frame"""
+        self.dirty.mark_all()
+    
+    def close(self):
+        """Cancel pending timers when the game is left or replaced"""
+        scheduler.cancel_owner(self)
     
     def calculate_grid_dimensions(self):
         """Calculate tile size and grid position based on word length"""
@@ -85,14 +104,14 @@ class VocabGame:
     def get_dynamic_letter_font(self):
         """Get font size based on tile size"""
         font_size = int(self.tile_size * 0.7)
-        return pygame.font.Font(None, font_size)
+        return get_font(None, font_size)
     
-    def render_decorations(self, screen):
+    def render_decorations(self, decor_surface):
         # Corner decorations - cats
         if self.assets.has("cat1"):
-            self.assets.draw(self.decor_surface, "cat1", (15, 30), size=(80, 80))
+            self.assets.draw(decor_surface, "cat1", (15, 30), size=(80, 80))
         if self.assets.has("cat2"):
-            self.assets.draw(self.decor_surface, "cat2", (SCREEN_WIDTH - 85, 30), size=(80, 80))
+            self.assets.draw(decor_surface, "cat2", (SCREEN_WIDTH - 85, 30), size=(80, 80))
         # Scattered paw prints
             paw_positions = [
                 (40, SCREEN_HEIGHT - 130),
@@ -108,32 +127,16 @@ class VocabGame:
                 (SCREEN_WIDTH // 1.5, SCREEN_HEIGHT - 300),
             ]
             for pos in paw_positions:
-                self.assets.draw(self.decor_surface, "paw_print", pos, size=(50, 50), center=True)
+                self.assets.draw(decor_surface, "paw_print", pos, size=(50, 50), center=True)
 
     def render_definition_wrapped(self):
         """Pre-render definition with word wrapping"""
-        words = self.definition.split()
-        lines = []
-        current_line = ""
-        max_width = SCREEN_WIDTH - 100
-        
-        for word in words:
-            test_line = current_line + word + " "
-            test_surface = self.fonts["definition"].render(test_line, True, BLACK)
-            if test_surface.get_width() < max_width:
-                current_line = test_line
-            else:
-                if current_line:
-                    lines.append(current_line.strip())
-                current_line = word + " "
-        
-        if current_line:
-            lines.append(current_line.strip())
+        lines = wrap_text(self.fonts["definition"], self.definition, SCREEN_WIDTH - 100)
         
         # Render each line
         surfaces = []
         for line in lines[:3]:  # Max 3 lines
-            surface = self.fonts["definition"].render(line, True, BLACK)
+            surface = render_text(self.fonts["definition"], line, True, BLACK)
             surfaces.append(surface)
         
         return surfaces
@@ -150,9 +153,12 @@ class VocabGame:
             if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
                 return "continue"
         
+        self.dirty.mark_changed([self.back_button, self.continue_button])
+        
         # Keyboard events
         if event.type != pygame.KEYDOWN:
             return None
+        self.dirty.mark(self.grid_area)
         
         # Don't allow input during animations or after game over
         if not self.can_input or self.animation_manager.is_animating():
@@ -194,7 +200,7 @@ class VocabGame:
         
         # Check win/lose after animation
         total_animation_time = FLIP_DURATION + (self.grid_cols - 1) * FLIP_DELAY
-        pygame.time.set_timer(pygame.USEREVENT, total_animation_time, 1)
+        scheduler.schedule(self, total_animation_time, ANIMATION_DONE_EVENT)
         
         if guess_str == self.secret_word:
             self.won = True
@@ -213,6 +219,7 @@ class VocabGame:
     
     def handle_animation_complete(self):
         """Called when animations complete"""
+        self.dirty.mark_all()
         self.can_input = True
         if self.game_message:
             self.game_over = True
@@ -257,91 +264,120 @@ class VocabGame:
         shake_offset = self.animation_manager.get_shake_offset(row)
         x += shake_offset
         
-        rect = pygame.Rect(x, y, self.tile_size, self.tile_size)
+        center = (x + self.tile_size // 2, y + self.tile_size // 2)
+        width = height = self.tile_size
+        color_state = None  # Empty or current input tile
         
         # Apply pop animation for current input
         if is_current and letter:
             pop_scale = self.animation_manager.get_pop_scale(row, col)
-            original_center = rect.center
-            rect.width = int(self.tile_size * pop_scale)
-            rect.height = int(self.tile_size * pop_scale)
-            rect.center = original_center
+            width = height = int(self.tile_size * pop_scale)
         
         # Apply flip animation for submitted guesses
-        if color_name and row < self.current_row:
+        if color_name:
             flip_scale = self.animation_manager.get_flip_scale(row, col)
-            original_center = rect.center
-            rect.height = int(self.tile_size * flip_scale)
-            rect.center = original_center
-            
+            height = int(self.tile_size * flip_scale)
             # Show color only in second half of flip
-            if flip_scale > 0.5:
-                tile_color = COLOR_MAP.get(color_name, CAT_GRAY)
-            else:
-                tile_color = WHITE
-            
-            pygame.draw.rect(screen, tile_color, rect, border_radius=5)
-            pygame.draw.rect(screen, OUTLINE_GRAY, rect, 2, border_radius=5)
-        elif color_name:
-            # Completed tiles (no animation)
-            tile_color = COLOR_MAP.get(color_name, CAT_GRAY)
-            pygame.draw.rect(screen, tile_color, rect, border_radius=5)
+            color_state = color_name if flip_scale > 0.5 else "hidden"
+        
+        if width <= 0 or height <= 0:
+            return  # Edge-on mid flip
+        
+        sprite = self.get_tile_sprite(letter, color_state)
+        if (width, height) != sprite.get_size():
+            # Only animating tiles are scaled
+            sprite = pygame.transform.scale(sprite, (width, height))
+        screen.blit(sprite, sprite.get_rect(center=center))
+    
+    def get_tile_sprite(self, letter, color_state):
+        """Get the pre-rendered tile for a letter and color state at this game's tile size"""
+        key = (letter, color_state, self.tile_size)
+        return tile_cache.get(key, self._render_tile_sprite, letter, color_state)
+    
+    def _render_tile_sprite(self, letter, color_state):
+        """Draw one unscaled tile; color_state is None (input), "hidden" (flipping) or a color name"""
+        surface = pygame.Surface((self.tile_size, self.tile_size), pygame.SRCALPHA)
+        rect = surface.get_rect()
+        
+        if color_state in (None, "hidden"):
+            tile_color = WHITE
         else:
-            # Empty or current input tiles
-            pygame.draw.rect(screen, WHITE, rect, border_radius=5)
-            pygame.draw.rect(screen, OUTLINE_GRAY, rect, 2, border_radius=5)
+            tile_color = COLOR_MAP.get(color_state, CAT_GRAY)
+        pygame.draw.rect(surface, tile_color, rect, border_radius=5)
+        pygame.draw.rect(surface, OUTLINE_GRAY, rect, 2, border_radius=5)
         
         # Render letter
         if letter:
-            text_color = FILLED_TEXT_COLOR if color_name else EMPTY_TEXT_COLOR
+            text_color = EMPTY_TEXT_COLOR if color_state is None else FILLED_TEXT_COLOR
             # Special rendering for space
             if letter == ' ':
                 display_letter = '_'
             else:
                 display_letter = letter
             
-            text_surface = self.fonts["letter"].render(display_letter, True, text_color)
+            text_surface = render_text(self.fonts["letter"], display_letter, True, text_color)
             text_rect = text_surface.get_rect(center=rect.center)
-            screen.blit(text_surface, text_rect)
+            surface.blit(text_surface, text_rect)
+        return surface
     
     def update(self):
         """Update animations"""
+        # Redraw the grid while anything animates (pops included), sampled
+        # before advancing so the frame where the last one ends still repaints
+        if self.animation_manager.has_animations():
+            self.dirty.mark(self.grid_area)
         self.animation_manager.update()
     
-    def render(self, screen):
-        """Render the game"""
-        screen.fill(BG_COLOR)
+    def next_update_in(self):
+        """0 while tiles are animating (same condition update() redraws on), otherwise None"""
+        return 0 if self.animation_manager.has_animations() else None
+    
+    def _build_background(self, size):
+        """Compose the parts of the screen shared by every round (built once per process)"""
+        background = pygame.Surface(size)
+        background.fill(BG_COLOR)
         
-         # Draw background decorations
-        screen.blit(self.decor_surface, (0, 0))
-        
-        # Back button
-        self.back_button.render(screen)
+        # Draw background decorations
+        decor_surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.render_decorations(decor_surface)
+        background.blit(decor_surface, (0, 0))
         
         # Title
         title_text = "Vocab Challenge"
-        title_surface = self.fonts["title"].render(title_text, True, BLACK)
+        title_surface = render_text(self.fonts["title"], title_text, True, BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 50))
-        screen.blit(title_surface, title_rect)
+        background.blit(title_surface, title_rect)
         
         # Definition box
         def_box_y = 100
         def_box_height = 120
         def_box = pygame.Rect(50, def_box_y, SCREEN_WIDTH - 100, def_box_height)
-        pygame.draw.rect(screen, WHITE, def_box, border_radius=10)
-        pygame.draw.rect(screen, CAT_YELLOW, def_box, 3, border_radius=10)
+        pygame.draw.rect(background, WHITE, def_box, border_radius=10)
+        pygame.draw.rect(background, CAT_YELLOW, def_box, 3, border_radius=10)
         
         # Definition label
-        def_label = self.fonts["definition"].render("Definition:", True, BLACK)
-        screen.blit(def_label, (60, def_box_y + 10))
+        def_label = render_text(self.fonts["definition"], "Definition:", True, BLACK)
+        background.blit(def_label, (60, def_box_y + 10))
+        return background
+    
+    def render(self, screen):
+        """Render the game, returns the dirty rects drawn"""
+        if not self.dirty:
+            return []
+        self.dirty.begin(screen)
+        
+        layers.blit(screen, "vocab_game", self._build_background)
         
         # Definition text (wrapped)
-        y_offset = def_box_y + 40
+        y_offset = 140
         for surface in self.def_surfaces:
             text_rect = surface.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
             screen.blit(surface, text_rect)
             y_offset += 30
         
+        # Back button
+        self.back_button.render(screen)
+        
         # Grid
         for row in range(self.grid_rows):
             for col in range(self.grid_cols):
@@ -362,7 +398,7 @@ class VocabGame:
         
         # Attempt counter
         attempts_text = f"Attempt: {self.current_row + 1}/{self.grid_rows}"
-        attempts_surface = pygame.font.Font(None, 26).render(attempts_text, True, BLACK)
+        attempts_surface = render_text(get_font(None, 26), attempts_text, True, BLACK)
         attempts_rect = attempts_surface.get_rect(center=(SCREEN_WIDTH // 2, self.grid_start_y + (self.grid_rows * (self.tile_size + self.tile_padding)) + 20))
         screen.blit(attempts_surface, attempts_rect)
         
@@ -377,14 +413,14 @@ class VocabGame:
                 self.assets.draw(screen, cat_image_key, (SCREEN_WIDTH // 2, cat_y), size=(100, 100), center=True)
             
             # Message
-            message_surface = self.fonts["message"].render(self.game_message, True, BLACK)
+            message_surface = render_text(self.fonts["message"], self.game_message, True, BLACK)
             message_rect = message_surface.get_rect(center=(SCREEN_WIDTH // 2, message_y))
             screen.blit(message_surface, message_rect)
             
             # Status update info
             status_text = f"Status: {self.word_obj.status.replace('_', ' ').title()}"
             status_color = CAT_GREEN if self.won else (CAT_YELLOW if self.attempts_used > 1 else (200, 50, 50))
-            status_surface = pygame.font.Font(None, 24).render(status_text, True, status_color)
+            status_surface = render_text(get_font(None, 24), status_text, True, status_color)
             status_rect = status_surface.get_rect(center=(SCREEN_WIDTH // 2, message_y + 35))
             screen.blit(status_surface, status_rect)
             
@@ -394,6 +430,8 @@ class VocabGame:
         # Instructions at bottom (only when not game over)
         if not self.game_over:
             hint_text = "Type letters, Space, or Hyphen (-) | ENTER to submit | BACKSPACE to delete"
-            hint_surface = pygame.font.Font(None, 20).render(hint_text, True, (120, 120, 120))
+            hint_surface = render_text(get_font(None, 20), hint_text, True, (120, 120, 120))
             hint_rect = hint_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 30))
-            screen.blit(hint_surface, hint_rect)
\ No newline at end of file
+            screen.blit(hint_surface, hint_rect)
+        
+        return self.dirty.end(screen)
@@ -1,7 +1,13 @@
 import pygame
 from settings import *
+from text_cache import render_text
+from text_layout import wrap_text
 from button import Button
 from data_manager import DataManager
+from dictionary_api import lookup_definition
+from workers import get_executor, post_event
+from dirty import DirtyTracker
+from layers import layers
 
 class InputBox:
     """Text input box component"""
@@ -12,11 +18,13 @@ class InputBox:
         self.max_length = max_length
         self.multiline = multiline
         self.active = False
-        self.font = pygame.font.Font(None, 32)
-        self.small_font = pygame.font.Font(None, 24)
+        self.font = get_font(None, 32)
+        self.small_font = get_font(None, 24)
         self.cursor_visible = True
-        self.cursor_timer = 0
+        self.cursor_blink_at = 0  # Ticks (ms) of the next cursor blink
         self.scroll_offset = 0
+        self.loading_text = None  # Shown instead of the placeholder while busy
+        self.needs_redraw = False  # Set when the cursor blinks, cleared by the page
         
     def handle_event(self, event):
         """Handle keyboard and mouse events"""
@@ -39,10 +47,21 @@ class InputBox:
     
     def update(self):
         """Update cursor blinking"""
-        self.cursor_timer += 1
-        if self.cursor_timer >= 30:  # Blink every 30 frames
+        now = pygame.time.get_ticks()
+        if now >= self.cursor_blink_at:
             self.cursor_visible = not self.cursor_visible
-            self.cursor_timer = 0
+            self.cursor_blink_at = now + CURSOR_BLINK_MS
+            self.needs_redraw = self.shows_cursor()
+    
+    def shows_cursor(self):
+        """Whether the blinking cursor is drawn"""
+        return self.active and bool(self.text) and not self.multiline
+    
+    def next_update_in(self, now):
+        """Milliseconds until the cursor next blinks, or None if no cursor is shown"""
+        if not self.shows_cursor():
+            return None
+        return max(0, self.cursor_blink_at - now)
     
     def render(self, screen):
         """Draw the input box"""
@@ -53,7 +72,7 @@ class InputBox:
         pygame.draw.rect(screen, border_color, self.rect, 3, border_radius=5)
         
         # Text or placeholder
-        display_text = self.text if self.text else self.placeholder
+        display_text = self.text if self.text else (self.loading_text or self.placeholder)
         text_color = BLACK if self.text else (150, 150, 150)
         
         if self.multiline:
@@ -61,39 +80,24 @@ class InputBox:
             self._render_multiline(screen, display_text, text_color)
         else:
             # Single line rendering for word
-            text_surface = self.font.render(display_text, True, text_color)
+            text_surface = render_text(self.font, display_text, True, text_color)
             text_rect = text_surface.get_rect(midleft=(self.rect.x + 10, self.rect.centery))
             screen.blit(text_surface, text_rect)
             
             # Cursor
-            if self.active and self.cursor_visible and self.text:
+            if self.cursor_visible and self.shows_cursor():
                 cursor_x = text_rect.right + 2
                 cursor_y = self.rect.centery - 15
                 pygame.draw.line(screen, BLACK, (cursor_x, cursor_y), (cursor_x, cursor_y + 30), 2)
     
     def _render_multiline(self, screen, text, color):
         """Render multi-line text with wrapping"""
-        words = text.split(' ')
-        lines = []
-        current_line = ""
-        
-        for word in words:
-            test_line = current_line + word + " "
-            test_surface = self.small_font.render(test_line, True, color)
-            if test_surface.get_width() < self.rect.width - 20:
-                current_line = test_line
-            else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = word + " "
-        
-        if current_line:
-            lines.append(current_line)
+        lines = wrap_text(self.small_font, text, self.rect.width - 20)
         
         # Render lines
         y_offset = self.rect.y + 10
         for line in lines[:4]:  # Max 4 lines visible
-            line_surface = self.small_font.render(line, True, color)
+            line_surface = render_text(self.small_font, line, True, color)
             screen.blit(line_surface, (self.rect.x + 10, y_offset))
             y_offset += 30
     
@@ -101,6 +105,10 @@ class InputBox:
         """Get the current text"""
         return self.text.strip()
     
+    def set_loading(self, text):
+        """Show a busy message in the empty box, or None to clear it"""
+        self.loading_text = text
+    
     def clear(self):
         """Clear the input"""
         self.text = ""
@@ -112,8 +120,8 @@ class WordListItem:
         self.word = word
         self.definition = definition
         self.rect = pygame.Rect(20, y_pos, width - 40, 60)
-        self.font = pygame.font.Font(None, 28)
-        self.small_font = pygame.font.Font(None, 22)
+        self.font = get_font(None, 28)
+        self.small_font = get_font(None, 22)
     
     def render(self, screen):
         """Draw the word list item"""
@@ -122,14 +130,14 @@ class WordListItem:
         pygame.draw.rect(screen, OUTLINE_COLOR, self.rect, 2, border_radius=5)
         
         # Word (bold)
-        word_surface = self.font.render(self.word, True, BLACK)
+        word_surface = render_text(self.font, self.word, True, BLACK)
         screen.blit(word_surface, (self.rect.x + 10, self.rect.y + 8))
         
         # Definition (smaller, truncated)
         def_text = self.definition
         if len(def_text) > 60:
             def_text = def_text[:60] + "..."
-        def_surface = self.small_font.render(def_text, True, (100, 100, 100))
+        def_surface = render_text(self.small_font, def_text, True, (100, 100, 100))
         screen.blit(def_surface, (self.rect.x + 10, self.rect.y + 35))
 
 
@@ -140,7 +148,7 @@ class WordInputPage:
         
         # Title
         self.title_font = get_title_font()
-        self.message_font = pygame.font.Font(None, 28)
+        self.message_font = get_font(None, 28)
         
         # Input boxes
         self.word_input = InputBox(50, 120, SCREEN_WIDTH - 100, 50, 
@@ -166,7 +174,19 @@ class WordInputPage:
         # Feedback message
         self.message = ""
         self.message_color = BLACK
-        self.message_timer = 0
+        self.message_until = 0  # Ticks (ms) when the message is cleared
+        
+        # Definition lookups running on the worker pool
+        self.lookups = {}  # word -> Future, so repeated lookups share one request
+        self.definition_cache = {}  # word -> definition (or None if not found)
+        self.pending_word = None  # Word waiting for its definition before being added
+        
+        # Rendering
+        self.dirty = DirtyTracker()
+    
+    def invalidate(self):
+        """Redraw everything on the next frame"""
+        self.dirty.mark_all()
         
     def add_word(self):
         """Add word to data manager"""
@@ -174,16 +194,21 @@ class WordInputPage:
         definition = self.def_input.get_text()
         
         if word and not definition:
-            from dictionary_api import get_definition  # or top-level import
-            api_def = get_definition(word)
-            if api_def:
-                definition = api_def
-                self.def_input.text = api_def
+            key = word.lower()
+            if key in self.definition_cache:
+                definition = self.definition_cache[key]
+                if not definition:
+                    self._show_not_found(word)
+                    return
+                self.def_input.text = definition
             else:
-                self.message = f"No definition found for '{word}', please enter manually."
-                self.message_color = (200, 50, 50)
+                self.start_lookup(key)
                 return
         
+        self._save_word(word, definition)
+    
+    def _save_word(self, word, definition):
+        """Store the word and update the feedback message"""
         success, message = self.data_manager.add_word(word, definition)
         
         if success:
@@ -198,17 +223,88 @@ class WordInputPage:
             self.message = message
             self.message_color = (200, 50, 50)
         
-        self.message_timer = 180  # Show for 3 seconds at 60fps
+        self.message_until = pygame.time.get_ticks() + MESSAGE_DURATION_MS
+    
+    def _show_not_found(self, word):
+        self.message = f"No definition found for '{word}', please enter manually."
+        self.message_color = (200, 50, 50)
+        self.message_until = pygame.time.get_ticks() + MESSAGE_DURATION_MS
+    
+    def _show_lookup_failed(self, word):
+        self.message = f"Couldn't look up '{word}', try again or enter it manually."
+        self.message_color = (200, 50, 50)
+        self.message_until = pygame.time.get_ticks() + MESSAGE_DURATION_MS
+    
+    def start_lookup(self, word):
+        """Look up a definition in the background; the result arrives as DEFINITION_LOOKUP_EVENT"""
+        self.pending_word = word
+        self.def_input.set_loading("Looking up definition…")
+        
+        if word in self.lookups:
+            return  # Already in flight
+        
+        future = get_executor().submit(lookup_definition, word)
+        self.lookups[word] = future
+        future.add_done_callback(lambda f: self._post_lookup_result(word, f))
+    
+    def _post_lookup_result(self, word, future):
+        """Worker thread: hand the finished lookup back to the pygame loop"""
+        if future.cancelled():
+            return
+        error = future.exception()
+        definition = None if error else future.result()
+        post_event(DEFINITION_LOOKUP_EVENT, word=word, definition=definition, error=error is not None)
+    
+    def cancel_lookup(self):
+        """Stop waiting for the pending lookup (a late result is only cached)"""
+        if self.pending_word is None:
+            return
+        future = self.lookups.get(self.pending_word)
+        if future and future.cancel():
+            del self.lookups[self.pending_word]
+        self.pending_word = None
+        self.def_input.set_loading(None)
+    
+    def handle_lookup_result(self, event):
+        """Receive a finished definition lookup from the worker pool"""
+        self.dirty.mark_all()
+        self.lookups.pop(event.word, None)
+        if not event.error:
+            self.definition_cache[event.word] = event.definition  # Failed lookups are retried next time
+        
+        if event.word != self.pending_word:
+            return  # Cancelled or superseded
+        self.pending_word = None
+        self.def_input.set_loading(None)
+        
+        if self.def_input.get_text():
+            return  # User typed a definition meanwhile
+        if event.definition:
+            self.def_input.text = event.definition
+            self._save_word(self.word_input.get_text(), event.definition)
+        elif event.error:
+            self._show_lookup_failed(event.word)
+        else:
+            self._show_not_found(event.word)
     
     def clear_inputs(self):
         """Clear both input boxes"""
+        self.cancel_lookup()
         self.word_input.clear()
         self.def_input.clear()
     
     def handle_event(self, event):
         """Handle all events"""
+        if event.type == DEFINITION_LOOKUP_EVENT:
+            return None  # Routed to handle_lookup_result by the main loop
+        
+        # Clicks and typing can change any of the inputs, messages and lists
+        if event.type in (pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN):
+            self.dirty.mark_all()
+        
         # Check back button first
         if self.back_button.handle_event(event):
+            self.cancel_lookup()
             return "back"
         
         # Buttons
@@ -217,6 +313,8 @@ class WordInputPage:
         
         # Input boxes
         result = self.word_input.handle_event(event)
+        if self.pending_word and self.word_input.get_text().lower() != self.pending_word:
+            self.cancel_lookup()  # Word was edited
         if result == "next":
             self.word_input.active = False
             self.def_input.active = True
@@ -230,36 +328,57 @@ class WordInputPage:
             self.def_input.active = False
             self.word_input.active = True
         
+        self.dirty.mark_changed([self.add_button, self.clear_button, self.back_button])
         return None
     
     def update(self):
         """Update animations"""
         self.word_input.update()
         self.def_input.update()
+        self.dirty.mark_changed([self.word_input, self.def_input])
         
-        # Update message timer
-        if self.message_timer > 0:
-            self.message_timer -= 1
-            if self.message_timer == 0:
-                self.message = ""
+        # Clear an expired message
+        if self.message and pygame.time.get_ticks() >= self.message_until:
+            self.message = ""
+            self.dirty.mark_all()
     
-    def render(self, screen):
-        """Draw the page"""
-        screen.fill(BG_COLOR)
+    def next_update_in(self):
+        """Milliseconds until the page changes on its own, or None if only input changes it"""
+        now = pygame.time.get_ticks()
+        waits = [self.word_input.next_update_in(now), self.def_input.next_update_in(now)]
+        if self.message:
+            waits.append(max(0, self.message_until - now))
+        waits = [w for w in waits if w is not None]
+        return min(waits) if waits else None
+    
+    def _build_background(self, size):
+        """Compose the parts of the page that never change"""
+        background = pygame.Surface(size)
+        background.fill(BG_COLOR)
         
         # Title
         title_text = "Add New Words"
-        title_surface = self.title_font.render(title_text, True, BLACK)
+        title_surface = render_text(self.title_font, title_text, True, BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 50))
-        screen.blit(title_surface, title_rect)
+        background.blit(title_surface, title_rect)
         
         # Labels
-        label_font = pygame.font.Font(None, 26)
-        word_label = label_font.render("Word:", True, BLACK)
-        screen.blit(word_label, (50, 95))
+        label_font = get_font(None, 26)
+        word_label = render_text(label_font, "Word:", True, BLACK)
+        background.blit(word_label, (50, 95))
         
-        def_label = label_font.render("Definition:", True, BLACK)
-        screen.blit(def_label, (50, 175))
+        def_label = render_text(label_font, "Definition:", True, BLACK)
+        background.blit(def_label, (50, 175))
+        return background
+    
+    def render(self, screen):
+        """Draw the page, returns the dirty rects drawn"""
+        if not self.dirty:
+            return []
+        self.dirty.begin(screen)
+        
+        layers.blit(screen, "word_input", self._build_background)
+        label_font = get_font(None, 26)
         
         # Input boxes
         self.word_input.render(screen)
@@ -272,13 +391,13 @@ class WordInputPage:
         
         # Feedback message
         if self.message:
-            message_surface = self.message_font.render(self.message, True, self.message_color)
+            message_surface = render_text(self.message_font, self.message, True, self.message_color)
             message_rect = message_surface.get_rect(center=(SCREEN_WIDTH // 2, 410))
             screen.blit(message_surface, message_rect)
         
         # Recently added words section
         if self.recent_words:
-            recent_label = self.message_font.render("Recently Added:", True, BLACK)
+            recent_label = render_text(self.message_font, "Recently Added:", True, BLACK)
             screen.blit(recent_label, (20, 450))
             
             y_pos = 500
@@ -292,5 +411,7 @@ class WordInputPage:
             char_count = len(self.word_input.text)
             counter_text = f"{char_count}/20"
             counter_color = (200, 50, 50) if char_count > 20 else (100, 100, 100)
-            counter_surface = label_font.render(counter_text, True, counter_color)
-            screen.blit(counter_surface, (SCREEN_WIDTH - 120, 95))
\ No newline at end of file
+            counter_surface = render_text(label_font, counter_text, True, counter_color)
+            screen.blit(counter_surface, (SCREEN_WIDTH - 120, 95))
+        
+        return self.dirty.end(screen)
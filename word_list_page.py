@@ -1,7 +1,17 @@
 import pygame
 from settings import *
+from text_cache import render_text, SurfaceCache
 from button import Button
 from data_manager import DataManager
+from dirty import DirtyTracker
+from layers import layers
+
+SCROLL_TOP = 240  # Top of the scrollable card area
+CARD_HEIGHT = 100
+ROW_HEIGHT = 110  # Card plus spacing
+
+# Pre-rendered cards, shared by every WordCard; keys include everything a card shows
+card_cache = SurfaceCache(CARD_CACHE_BUDGET)
 
 class FilterButton(Button):
     """Filter button with active state"""
@@ -25,19 +35,19 @@ class FilterButton(Button):
         pygame.draw.rect(screen, color, self.rect, border_radius=8)
         pygame.draw.rect(screen, BUTTON_TEXT, self.rect, 2, border_radius=8)
         
-        text_surface = self.font.render(self.text, True, text_color)
+        text_surface = render_text(self.font, self.text, True, text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
 
 
 class WordCard:
-    """Display card for a single word"""
-    def __init__(self, word_obj, y_pos, width):
-        self.word_obj = word_obj
-        self.rect = pygame.Rect(20, y_pos, width - 40, 100)
-        self.word_font = pygame.font.Font(None, 32)
-        self.def_font = pygame.font.Font(None, 22)
-        self.stats_font = pygame.font.Font(None, 20)
+    """Display card for a single word; recycled for different words as the list scrolls"""
+    def __init__(self, width):
+        self.word_obj = None  # Bound by WordListPage while the card's row is on screen
+        self.rect = pygame.Rect(20, 0, width - 40, CARD_HEIGHT)
+        self.word_font = get_font(None, 32)
+        self.def_font = get_font(None, 22)
+        self.stats_font = get_font(None, 20)
         
         # Delete button
         delete_size = 30
@@ -48,23 +58,58 @@ class WordCard:
             "X", 
             lambda: None
         )
-        self.delete_button.font = pygame.font.Font(None, 28)
+        self.delete_button.font = get_font(None, 28)
         
         self.hovered = False
     
+    def bind(self, word_obj, y_pos):
+        """Show word_obj at screen position y_pos"""
+        self.word_obj = word_obj
+        self.rect.y = y_pos
+        self.delete_button.rect.y = y_pos + 10
+    
+    def set_hover(self, pos):
+        """Update hover state for a mouse position (None = mouse elsewhere), returns True if it changed"""
+        hovered = pos is not None and self.rect.collidepoint(pos)
+        delete_hovered = hovered and self.delete_button.rect.collidepoint(pos)
+        changed = hovered != self.hovered or delete_hovered != self.delete_button.hovered
+        self.hovered = hovered
+        self.delete_button.hovered = delete_hovered
+        return changed
+    
     def handle_event(self, event):
-        """Handle mouse events"""
-        if event.type == pygame.MOUSEMOTION:
-            self.hovered = self.rect.collidepoint(event.pos)
-        
-        # Check delete button
+        """Handle a click on this card"""
         if self.delete_button.handle_event(event):
             return ("delete", self.word_obj.word)
-        
         return None
     
+    def cache_key(self):
+        """The word plus a version stamp of everything drawn on the card"""
+        w = self.word_obj
+        return (w.word, w.status, w.attempts, w.correct, w.wrong, w.definition,
+                self.hovered, self.delete_button.hovered)
+    
     def render(self, screen):
-        """Draw the word card"""
+        """Draw the word card from its cached surface"""
+        screen.blit(card_cache.get(self.cache_key(), self._render_surface), self.rect)
+    
+    def _render_surface(self):
+        """Render the card once to an offscreen surface (opaque: corners show the page background)"""
+        surface = pygame.Surface(self.rect.size).convert()
+        surface.fill(BG_COLOR)
+        screen_rect = self.rect
+        button_rect = self.delete_button.rect
+        self.rect = surface.get_rect()
+        self.delete_button.rect = button_rect.move(-screen_rect.x, -screen_rect.y)
+        try:
+            self._draw(surface)
+        finally:
+            self.rect = screen_rect
+            self.delete_button.rect = button_rect
+        return surface
+    
+    def _draw(self, screen):
+        """Draw the card at self.rect"""
         # Background color based on status
         status_colors = {
             "not_learned": (255, 240, 240),  # Light red
@@ -86,19 +131,19 @@ class WordCard:
         pygame.draw.rect(screen, border_color, self.rect, 3 if self.hovered else 2, border_radius=8)
         
         # Word (bold)
-        word_surface = self.word_font.render(self.word_obj.word, True, BLACK)
+        word_surface = render_text(self.word_font, self.word_obj.word, True, BLACK)
         screen.blit(word_surface, (self.rect.x + 15, self.rect.y + 12))
         
         # Definition (truncated)
         def_text = self.word_obj.definition
         if len(def_text) > 70:
             def_text = def_text[:70] + "..."
-        def_surface = self.def_font.render(def_text, True, (80, 80, 80))
+        def_surface = render_text(self.def_font, def_text, True, (80, 80, 80))
         screen.blit(def_surface, (self.rect.x + 15, self.rect.y + 45))
         
         # Stats at bottom
         stats_text = f"Attempts: {self.word_obj.attempts} | Correct: {self.word_obj.correct} | Wrong: {self.word_obj.wrong}"
-        stats_surface = self.stats_font.render(stats_text, True, (120, 120, 120))
+        stats_surface = render_text(self.stats_font, stats_text, True, (120, 120, 120))
         screen.blit(stats_surface, (self.rect.x + 15, self.rect.y + 72))
         
         # Status badge (top right)
@@ -113,7 +158,7 @@ class WordCard:
         )
         pygame.draw.rect(screen, badge_color, badge_rect, border_radius=5)
         
-        badge_surface = pygame.font.Font(None, 22).render(status_text, True, WHITE)
+        badge_surface = render_text(get_font(None, 22), status_text, True, WHITE)
         badge_text_rect = badge_surface.get_rect(center=badge_rect.center)
         screen.blit(badge_surface, badge_text_rect)
         
@@ -153,13 +198,13 @@ class SearchBox:
         pygame.draw.rect(screen, border_color, self.rect, 2, border_radius=5)
         
         # Search icon
-        icon_surface = self.font.render("🔍", True, (100, 100, 100))
+        icon_surface = render_text(self.font, "🔍", True, (100, 100, 100))
         screen.blit(icon_surface, (self.rect.x + 10, self.rect.y + 8))
         
         # Text or placeholder
         display_text = self.text if self.text else "Search words..."
         text_color = BLACK if self.text else (150, 150, 150)
-        text_surface = self.font.render(display_text, True, text_color)
+        text_surface = render_text(self.font, display_text, True, text_color)
         screen.blit(text_surface, (self.rect.x + 45, self.rect.y + 10))
     
     def get_text(self):
@@ -174,7 +219,7 @@ class WordListPage:
         
         # Fonts
         self.title_font = get_title_font()
-        self.subtitle_font = pygame.font.Font(None, 26)
+        self.subtitle_font = get_font(None, 26)
         
         # Filter buttons
         filter_y = 120
@@ -229,10 +274,25 @@ class WordListPage:
         self.scroll_offset = 0
         self.max_scroll = 0
         
-        # Word cards
-        self.word_cards = []
+        # Rendering
+        self.dirty = DirtyTracker()
+        
+        # Word cards: only enough for one screen plus a margin, reused for
+        # whichever rows are visible (row i is always drawn by card i % pool size)
+        visible_rows = -(-(SCREEN_HEIGHT - SCROLL_TOP) // ROW_HEIGHT)
+        self.card_pool = [WordCard(SCREEN_WIDTH) for _ in range(visible_rows + 2)]
+        self.hovered_card = None
+        self.words = []  # Filtered and searched Word objects, in display order
         self.update_word_list()
     
+    def invalidate(self):
+        """Redraw everything on the next frame"""
+        self.dirty.mark_all()
+    
+    def next_update_in(self):
+        """Nothing animates here: the page only changes on input"""
+        return None
+    
     def set_filter(self, filter_value):
         """Set the active filter"""
         self.current_filter = filter_value
@@ -253,22 +313,56 @@ class WordListPage:
             words = [w for w in words if self.search_query in w.word.lower() or 
                      self.search_query in w.definition.lower()]
         
-        # Create word cards
-        self.word_cards = []
-        y_pos = 0
-        for word_obj in words:
-            card = WordCard(word_obj, y_pos, SCREEN_WIDTH)
-            self.word_cards.append(card)
-            y_pos += 110
+        self.words = words
         
         # Calculate max scroll
-        content_height = len(self.word_cards) * 110
-        visible_height = SCREEN_HEIGHT - 240 - 20
+        content_height = len(self.words) * ROW_HEIGHT
+        visible_height = SCREEN_HEIGHT - SCROLL_TOP - 20  # Keep a margin below the last card
         self.max_scroll = max(0, content_height - visible_height)
         self.scroll_offset = min(self.scroll_offset, self.max_scroll)
+        self._layout_cards()
+        self.dirty.mark_all()
+    
+    def _visible_rows(self):
+        """Range of row indices at least partly inside the scroll area"""
+        first = self.scroll_offset // ROW_HEIGHT
+        last = (self.scroll_offset + SCREEN_HEIGHT - SCROLL_TOP) // ROW_HEIGHT
+        return range(first, min(last + 1, len(self.words)))
+    
+    def _layout_cards(self):
+        """Bind pooled cards to the visible rows at their current screen positions"""
+        for card in self.card_pool:
+            card.word_obj = None
+        for index in self._visible_rows():
+            card = self.card_pool[index % len(self.card_pool)]
+            card.bind(self.words[index], SCROLL_TOP + index * ROW_HEIGHT - self.scroll_offset)
+    
+    def _card_at(self, pos):
+        """The card under a screen position, found from its row index"""
+        if not self._scroll_area().collidepoint(pos):
+            return None
+        index = (pos[1] - SCROLL_TOP + self.scroll_offset) // ROW_HEIGHT
+        if index >= len(self.words):
+            return None
+        card = self.card_pool[index % len(self.card_pool)]
+        return card if card.rect.collidepoint(pos) else None
+    
+    def _update_hover(self, pos):
+        """Move card hover to whatever is under the mouse, marking changed cards"""
+        card = self._card_at(pos)
+        if self.hovered_card and self.hovered_card is not card:
+            if self.hovered_card.set_hover(None):
+                self.dirty.mark(self.hovered_card.rect.clip(self._scroll_area()))
+        if card and card.set_hover(pos):
+            self.dirty.mark(card.rect.clip(self._scroll_area()))
+        self.hovered_card = card
     
     def handle_event(self, event):
         """Handle all events"""
+        # Clicks and typing can change filters, search and the list itself
+        if event.type in (pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN):
+            self.dirty.mark_all()
+        
         # Back button
         if self.back_button.handle_event(event):
             return "back"
@@ -287,42 +381,53 @@ class WordListPage:
         if event.type == pygame.MOUSEWHEEL:
             self.scroll_offset -= event.y * 30
             self.scroll_offset = max(0, min(self.scroll_offset, self.max_scroll))
+            self._layout_cards()
+            self._update_hover(pygame.mouse.get_pos())
+            self.dirty.mark(self._scroll_area())
         
-        # Word cards (with scroll offset)
-        for card in self.word_cards:
-            # Adjust card position for scrolling
-            original_y = card.rect.y
-            card.rect.y = original_y - self.scroll_offset + 240
-            card.delete_button.rect.y = card.rect.y + 10
-            
-            result = card.handle_event(event)
-            
-            # Restore original position
-            card.rect.y = original_y
-            card.delete_button.rect.y = original_y + 10
-            
+        # Word cards: only the one under the mouse can react
+        if event.type == pygame.MOUSEMOTION:
+            self._update_hover(event.pos)
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            card = self._card_at(event.pos)
+            result = card.handle_event(event) if card else None
             if result and result[0] == "delete":
                 # Confirm and delete
                 word_to_delete = result[1]
                 self.data_manager.delete_word(word_to_delete)
                 self.update_word_list()
+                self._update_hover(event.pos)
                 return None
         
+        self.dirty.mark_changed([self.back_button] + self.filter_buttons)
         return None
     
+    def _scroll_area(self):
+        """Screen region the word cards scroll in"""
+        return pygame.Rect(0, SCROLL_TOP, SCREEN_WIDTH, SCREEN_HEIGHT - SCROLL_TOP)
+    
+    def _build_background(self, size):
+        """Compose the parts of the page that never change"""
+        background = pygame.Surface(size)
+        background.fill(BG_COLOR)
+        title_surface = render_text(self.title_font, "Word List & Tracker", True, BLACK)
+        title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 50))
+        background.blit(title_surface, title_rect)
+        return background
+    
     def render(self, screen):
-        """Draw the word list page"""
-        screen.fill(BG_COLOR)
+        """Draw the word list page, returns the dirty rects drawn"""
+        if not self.dirty:
+            return []
+        self.dirty.begin(screen)
+        
+        layers.blit(screen, "word_list", self._build_background)
         self.back_button.render(screen)
 
-        # Title & stats
-        title_surface = self.title_font.render("Word List & Tracker", True, BLACK)
-        title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 50))
-        screen.blit(title_surface, title_rect)
-
+        # Stats
         stats = self.data_manager.get_statistics()
         stats_text = f"Total: {stats['total']} | Not Learned: {stats['not_learned']} | Few Mistakes: {stats['few_mistakes']} | Learned: {stats['learned']}"
-        stats_surface = self.subtitle_font.render(stats_text, True, (100, 100, 100))
+        stats_surface = render_text(self.subtitle_font, stats_text, True, (100, 100, 100))
         screen.blit(stats_surface, stats_surface.get_rect(center=(SCREEN_WIDTH // 2, 85)))
 
         # Filters + search
@@ -330,33 +435,23 @@ class WordListPage:
             button.render(screen)
         self.search_box.render(screen)
 
-        # Scrollable area
-        scroll_top = 240
-        scroll_height = SCREEN_HEIGHT - scroll_top
-        scroll_area = pygame.Rect(0, scroll_top, SCREEN_WIDTH, scroll_height)
-        screen.set_clip(scroll_area)
-
-        if self.word_cards:
-            for card in self.word_cards:
-                # Compute visible position
-                display_y = card.rect.y - self.scroll_offset
-                if display_y + card.rect.height >= 0 and display_y <= scroll_height:
-                    # Temporarily move rect
-                    original_y = card.rect.y
-                    card.rect.y = display_y + scroll_top
-                    card.delete_button.rect.y = card.rect.y + 10
+        # Scrollable area (kept within the dirty clip)
+        scroll_area = self._scroll_area()
+        scroll_top = scroll_area.y
+        scroll_height = scroll_area.height
+        dirty_clip = screen.get_clip()
+        screen.set_clip(scroll_area.clip(dirty_clip))
 
+        if self.words:
+            for card in self.card_pool:
+                if card.word_obj:
                     card.render(screen)
-
-                    # Restore original position
-                    card.rect.y = original_y
-                    card.delete_button.rect.y = original_y + 10
         else:
             text = "No words found" if self.search_query else "No words yet. Add some words!"
-            text_surface = pygame.font.Font(None, 32).render(text, True, (150, 150, 150))
+            text_surface = render_text(get_font(None, 32), text, True, (150, 150, 150))
             screen.blit(text_surface, text_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)))
 
-        screen.set_clip(None)
+        screen.set_clip(dirty_clip)
 
         # Scroll indicator
         if self.max_scroll > 0:
@@ -365,3 +460,5 @@ class WordListPage:
             indicator_x = SCREEN_WIDTH - 14
             indicator_y = scroll_top + int((self.scroll_offset / self.max_scroll) * (scroll_height - indicator_height))
             pygame.draw.rect(screen, CAT_GRAY, (indicator_x, indicator_y, 4, indicator_height), border_radius=2)
+
+        return self.dirty.end(screen)
@@ -0,0 +1,236 @@
+import json
+import os
+import queue
+import threading
+import time
+from collections import deque
+from settings import PREFETCH_EVENT
+from timers import scheduler
+from workers import CancelToken, post_event
+
+
+class WordPrefetcher:
+    """
+    Bounded producer/consumer buffer of ready-to-play (word, definition) pairs.
+    Fetches run as short tasks on a shared executor, keeping up to `depth`
+    pairs ready and refilling the buffer as the game consumes them.
+    A failed fetch posts PREFETCH_EVENT (kind="failed"); the main loop hands
+    it back to handle_event, which schedules the retry on the timer scheduler.
+    """
+    def __init__(self, fetch_fn, executor, depth=3, max_inflight=1, retry_delay=2.0, recent_limit=100):
+        self.fetch_fn = fetch_fn  # Returns (word, definition) or (None, None)
+        self.executor = executor
+        self.depth = depth
+        self.max_inflight = max_inflight
+        self.retry_delay = retry_delay
+        self.buffer = queue.Queue(maxsize=depth)
+        self.token = CancelToken()
+        self.inflight = 0  # Fetches running or backing off before a retry
+        self.retries = 0  # Retries waiting on the scheduler, each holding a fetch slot (main thread only)
+        self.recent = deque(maxlen=recent_limit)  # Recently played words, never re-queued
+
+        # Metrics
+        self._lock = threading.Lock()
+        self.fetched = 0
+        self.failed = 0
+        self.hits = 0  # Word was ready when requested
+        self.misses = 0  # Caller had to wait
+        self.fetch_times = []  # Recent fetch latencies (seconds)
+        self.wait_times = []  # Recent consumer wait latencies (seconds)
+
+    def start(self):
+        """
+        Begin filling the buffer, or resume after stop()
+        (call after load() to avoid refetching restored words)
+        """
+        if self.token.cancelled:
+            self.token = CancelToken()
+        self.refill()
+
+    def refill(self):
+        """Submit fetch tasks until ready + in-flight pairs reach the buffer depth"""
+        with self._lock:
+            if self.token.cancelled:
+                return
+            wanted = self.depth - self.buffer.qsize() - self.inflight
+            count = max(0, min(wanted, self.max_inflight - self.inflight))
+            self.inflight += count
+        for _ in range(count):
+            try:
+                self.executor.submit(self._fetch_one)
+            except RuntimeError:
+                # Executor shut down (interpreter exiting)
+                with self._lock:
+                    self.inflight -= 1
+
+    def _fetch_one(self):
+        """Worker task: fetch one pair into the buffer"""
+        if self.token.cancelled:
+            self._finish_fetch()  # Stopped while queued
+            return
+
+        start = time.perf_counter()
+        try:
+            word, definition = self.fetch_fn()
+        except Exception as e:
+            print(f"Prefetch error: {e}")
+            word, definition = None, None
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            if word and definition:
+                self.fetched += 1
+                self._record(self.fetch_times, elapsed)
+            else:
+                self.failed += 1
+
+        if word and definition:
+            if not self._is_duplicate(word):
+                try:
+                    self.buffer.put_nowait((word, definition))
+                except queue.Full:
+                    pass
+        elif not self.token.cancelled:
+            # The slot stays taken until the retry fires on the main thread
+            post_event(PREFETCH_EVENT, owner=self, kind="failed")
+            return
+
+        self._finish_fetch()
+
+    def handle_event(self, event):
+        """Main thread: back off after a failed fetch, then retry"""
+        if event.kind == "failed":
+            if self.token.cancelled:
+                self._finish_fetch()  # Failed after stop(): just free the slot
+                return
+            self.retries += 1
+            scheduler.schedule(self, int(self.retry_delay * 1000), PREFETCH_EVENT, kind="retry")
+        elif event.kind == "retry" and self.retries:  # Ignore one posted just before stop()
+            self.retries -= 1
+            self._finish_fetch()
+
+    def _finish_fetch(self):
+        """Release a fetch slot and top the buffer up again"""
+        with self._lock:
+            self.inflight -= 1
+        self.refill()
+
+    def _is_duplicate(self, word):
+        """Check a word against recently played and already buffered words"""
+        with self._lock:
+            if word in self.recent:
+                return True
+        with self.buffer.mutex:
+            return any(w == word for w, _ in self.buffer.queue)
+
+    def mark_played(self, word):
+        """Remember a played word so it is not queued again soon"""
+        with self._lock:
+            self.recent.append(word)
+
+    def save(self, filepath):
+        """Write ready pairs and recently played words to disk"""
+        with self.buffer.mutex:
+            ready = [list(pair) for pair in self.buffer.queue]
+        with self._lock:
+            recent = list(self.recent)
+        try:
+            directory = os.path.dirname(filepath)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump({"ready": ready, "recent": recent}, f, ensure_ascii=False)
+            print(f"✓ Saved {len(ready)} queued words to {filepath}")
+        except Exception as e:
+            print(f"✗ Error saving word queue: {e}")
+
+    def load(self, filepath):
+        """Restore a saved queue, skipping duplicates and anything beyond the buffer depth"""
+        if not os.path.exists(filepath):
+            return
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"✗ Error loading word queue: {e}")
+            return
+
+        with self._lock:
+            self.recent.extend(data.get("recent", []))
+        restored = 0
+        for pair in data.get("ready", []):
+            if len(pair) != 2 or not all(pair) or self._is_duplicate(pair[0]):
+                continue
+            try:
+                self.buffer.put_nowait((pair[0], pair[1]))
+                restored += 1
+            except queue.Full:
+                break
+        print(f"✓ Restored {restored} queued words from {filepath}")
+
+    def _record(self, samples, value, keep=50):
+        samples.append(value)
+        if len(samples) > keep:
+            del samples[0]
+
+    def get_nowait(self, waiting_since=None):
+        """
+        Get a ready pair immediately, or None if the buffer is empty.
+        waiting_since: time.perf_counter() when the caller started waiting,
+        so a pair that was not ready at first counts as a miss.
+        """
+        try:
+            item = self.buffer.get_nowait()
+        except queue.Empty:
+            return None
+        if waiting_since is None:
+            with self._lock:
+                self.hits += 1
+                self._record(self.wait_times, 0.0)
+        else:
+            self.record_miss(waiting_since)
+        self.refill()
+        return item
+
+    def record_miss(self, waiting_since):
+        """Count a request that had to wait (for a pair or for the caller's fallback)"""
+        with self._lock:
+            self.misses += 1
+            self._record(self.wait_times, time.perf_counter() - waiting_since)
+
+    def queue_depth(self):
+        """Number of pairs ready to play"""
+        return self.buffer.qsize()
+
+    def metrics(self):
+        """Snapshot of buffer depth and latency statistics (ms)"""
+        with self._lock:
+            fetch_times = list(self.fetch_times)
+            wait_times = list(self.wait_times)
+            requests = self.hits + self.misses
+            return {
+                "depth": self.queue_depth(),
+                "capacity": self.depth,
+                "inflight": self.inflight,
+                "fetched": self.fetched,
+                "failed": self.failed,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / requests if requests else 0.0,
+                "avg_fetch_ms": _avg_ms(fetch_times),
+                "max_fetch_ms": max(fetch_times) * 1000 if fetch_times else 0.0,
+                "avg_wait_ms": _avg_ms(wait_times),
+                "max_wait_ms": max(wait_times) * 1000 if wait_times else 0.0,
+            }
+
+    def stop(self):
+        """Stop fetching (main thread): queued fetches exit and pending retries are dropped"""
+        self.token.cancel()
+        scheduler.cancel_owner(self)
+        with self._lock:
+            self.inflight -= self.retries
+        self.retries = 0
+
+
+def _avg_ms(samples):
+    return sum(samples) / len(samples) * 1000 if samples else 0.0
@@ -0,0 +1,34 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from settings import WORKER_THREADS
+
+_executor = None
+_executor_lock = threading.Lock()
+
+def get_executor():
+    """Shared, bounded thread pool for background work (network lookups etc.)"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=WORKER_THREADS, thread_name_prefix="purrdle-worker")
+        return _executor
+
+def post_event(event_type, **attrs):
+    """Post a pygame event from any thread, ignored once pygame has shut down"""
+    try:
+        pygame.event.post(pygame.event.Event(event_type, attrs))
+    except pygame.error:
+        pass
+
+class CancelToken:
+    """Cooperative cancellation flag shared between an owner and its background tasks"""
+    def __init__(self):
+        self._event = threading.Event()
+    
+    def cancel(self):
+        self._event.set()
+    
+    @property
+    def cancelled(self):
+        return self._event.is_set()